@@ -1,20 +1,21 @@
 """CLI for syslog-fwd."""
 
-import asyncio
+# Heavy modules (asyncio, structlog, pydantic via .config) are imported inside the
+# commands that need them so that lightweight verbs start quickly.
+from __future__ import annotations
+
 import sys
 from pathlib import Path
 
 import click
-import structlog
-import yaml
 
 from . import __version__
-from .config import Config, load_config
-from .forwarder import SyslogForwarder
 
 
 def configure_logging(level: str) -> None:
     """Configure structlog for console output."""
+    import structlog
+
     structlog.configure(
         processors=[
             structlog.stdlib.add_log_level,
@@ -49,6 +50,13 @@ def main() -> None:
 )
 def run(config_path: Path) -> None:
     """Run the syslog forwarder."""
+    import asyncio
+
+    import structlog
+
+    from .config import load_config
+    from .forwarder import SyslogForwarder
+
     try:
         config = load_config(config_path)
     except FileNotFoundError as e:
@@ -85,22 +93,26 @@ def run(config_path: Path) -> None:
 )
 def validate(config_path: Path) -> None:
     """Validate configuration file."""
+    from .config import load_config
+
     try:
         config = load_config(config_path)
-        click.echo(f"✓ Configuration is valid: {config_path}")
-        click.echo(f"  Inputs: {len(config.inputs)}")
-        click.echo(f"  Transforms: {len(config.transforms)}")
-        click.echo(f"  Filters: {len(config.filters)}")
-        click.echo(f"  Destinations: {len(config.destinations)}")
+        lines = [
+            f"✓ Configuration is valid: {config_path}",
+            f"  Inputs: {len(config.inputs)}",
+            f"  Transforms: {len(config.transforms)}",
+            f"  Filters: {len(config.filters)}",
+            f"  Destinations: {len(config.destinations)}",
+        ]
 
         # Show summary
         if config.inputs:
-            click.echo("\n  Inputs:")
+            lines.append("\n  Inputs:")
             for inp in config.inputs:
-                click.echo(f"    - {inp.name}: {inp.protocol.value}://{inp.address}")
+                lines.append(f"    - {inp.name}: {inp.protocol.value}://{inp.address}")
 
         if config.transforms:
-            click.echo("\n  Transforms:")
+            lines.append("\n  Transforms:")
             for t in config.transforms:
                 ops = []
                 if t.remove_fields:
@@ -115,21 +127,24 @@ def validate(config_path: Path) -> None:
                     ops.append("prefix")
                 if t.message_suffix:
                     ops.append("suffix")
-                click.echo(f"    - {t.name}: {', '.join(ops) if ops else '(no-op)'}")
+                lines.append(f"    - {t.name}: {', '.join(ops) if ops else '(no-op)'}")
 
         if config.filters:
-            click.echo("\n  Filters:")
+            lines.append("\n  Filters:")
             for f in config.filters:
                 if f.action == "forward":
                     transforms_str = f" [transforms: {', '.join(f.transforms)}]" if f.transforms else ""
-                    click.echo(f"    - {f.name}: → {', '.join(f.destinations or [])}{transforms_str}")
+                    lines.append(f"    - {f.name}: → {', '.join(f.destinations or [])}{transforms_str}")
                 else:
-                    click.echo(f"    - {f.name}: [DROP]")
+                    lines.append(f"    - {f.name}: [DROP]")
 
         if config.destinations:
-            click.echo("\n  Destinations:")
+            lines.append("\n  Destinations:")
             for d in config.destinations:
-                click.echo(f"    - {d.name}: {d.protocol.value}://{d.address} ({d.format.value})")
+                lines.append(f"    - {d.name}: {d.protocol.value}://{d.address} ({d.format.value})")
+
+        # One write for the whole report
+        click.echo("\n".join(lines))
 
     except FileNotFoundError as e:
         click.echo(f"✗ Error: {e}", err=True)
@@ -196,23 +211,59 @@ def simulate(
             click.echo(f"Error: Failed to connect: {e}", err=True)
             sys.exit(1)
 
-    interval = 1.0 / rate if rate > 0 else 0
+    # Pace against absolute monotonic deadlines so sleep overshoot does not accumulate
+    step_ns = int(1e9 / rate) if rate > 0 else 0
+    spin_ns = 200_000  # Busy-wait the last 200us instead of trusting sleep granularity
     sent = 0
 
+    # Without pacing, coalesce TCP frames so one sendmsg() carries many messages.
+    # UDP keeps one sendto() per datagram: each message must stay its own datagram.
+    batch_size = 32 if protocol == "tcp" and step_ns == 0 else 1
+    batch: list[bytes] = []
+
+    def flush() -> None:
+        nonlocal sent
+        written = sock.sendmsg(batch)
+        total = sum(len(b) for b in batch)
+        if written < total:
+            sock.sendall(b"".join(batch)[written:])
+        sent += len(batch)
+        batch.clear()
+
+    # <PRI>TIMESTAMP simulator syslog-fwd-simulator[i]: Test message i+1/count
+    # Only the timestamp and counters change per message; the rest is encoded once.
+    pri_bytes = f"<{pri}>".encode()
+    tag_bytes = b" simulator syslog-fwd-simulator["
+    text_bytes = b"]: Test message "
+    tail_bytes = f"/{count}".encode() + (b"\n" if protocol == "tcp" else b"")
+
+    deadline = time.monotonic_ns()
+
     try:
         for i in range(count):
-            ts = datetime.now().strftime("%b %d %H:%M:%S")
-            hostname = "simulator"
-            msg = f"<{pri}>{ts} {hostname} syslog-fwd-simulator[{i}]: Test message {i + 1}/{count}"
+            ts = datetime.now().strftime("%b %d %H:%M:%S").encode()
+            msg = b"".join(
+                (pri_bytes, ts, tag_bytes, b"%d" % i, text_bytes, b"%d" % (i + 1), tail_bytes)
+            )
 
             if protocol == "udp":
-                sock.sendto(msg.encode(), (host, port))
+                sock.sendto(msg, (host, port))
+                sent += 1
             else:
-                sock.send((msg + "\n").encode())
+                batch.append(msg)
+                if len(batch) >= batch_size:
+                    flush()
+
+            if step_ns and i < count - 1:
+                deadline += step_ns
+                remaining = deadline - time.monotonic_ns()
+                if remaining > spin_ns:
+                    time.sleep((remaining - spin_ns) / 1e9)
+                while time.monotonic_ns() < deadline:
+                    pass
 
-            sent += 1
-            if interval > 0 and i < count - 1:
-                time.sleep(interval)
+        if batch:
+            flush()
 
         click.echo(f"✓ Sent {sent} messages")
     except Exception as e:
@@ -248,6 +299,7 @@ def simulate(
 )
 def export_config(config_path: Path, output: Path | None, output_format: str) -> None:
     """Export configuration to other formats (e.g., syslog-ng)."""
+    from .config import load_config
     from .export_syslogng import export_to_syslogng
 
     try:
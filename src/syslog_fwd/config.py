@@ -1,13 +1,39 @@
 """Configuration models for syslog-fwd."""
 
+import functools
+import hashlib
 import os
 import re
+import tempfile
+from collections.abc import Mapping
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Annotated, Literal
 
 import yaml
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
+from . import __version__
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
 
 class Protocol(str, Enum):
@@ -55,35 +81,39 @@ class Facility(str, Enum):
     LOCAL7 = "local7"
 
 
+# Facility names indexed by numeric value
+FACILITY_NAMES: tuple[str, ...] = (
+    "kern",
+    "user",
+    "mail",
+    "daemon",
+    "auth",
+    "syslog",
+    "lpr",
+    "news",
+    "uucp",
+    "cron",
+    "authpriv",
+    "ftp",
+    "ntp",
+    "audit",
+    "alert",
+    "clock",
+    "local0",
+    "local1",
+    "local2",
+    "local3",
+    "local4",
+    "local5",
+    "local6",
+    "local7",
+)
+
 # Facility name to numeric value mapping
-FACILITY_MAP: dict[str, int] = {
-    "kern": 0,
-    "user": 1,
-    "mail": 2,
-    "daemon": 3,
-    "auth": 4,
-    "syslog": 5,
-    "lpr": 6,
-    "news": 7,
-    "uucp": 8,
-    "cron": 9,
-    "authpriv": 10,
-    "ftp": 11,
-    "ntp": 12,
-    "audit": 13,
-    "alert": 14,
-    "clock": 15,
-    "local0": 16,
-    "local1": 17,
-    "local2": 18,
-    "local3": 19,
-    "local4": 20,
-    "local5": 21,
-    "local6": 22,
-    "local7": 23,
-}
-
-FACILITY_REVERSE_MAP: dict[int, str] = {v: k for k, v in FACILITY_MAP.items()}
+FACILITY_MAP: dict[str, int] = {name: i for i, name in enumerate(FACILITY_NAMES)}
+
+# Read-only view for callers that need the mapping API; hot paths index FACILITY_NAMES
+FACILITY_REVERSE_MAP: Mapping[int, str] = MappingProxyType(dict(enumerate(FACILITY_NAMES)))
 
 
 class Severity(str, Enum):
@@ -99,112 +129,223 @@ class Severity(str, Enum):
     DEBUG = "debug"
 
 
+# Severity names indexed by numeric value
+SEVERITY_NAMES: tuple[str, ...] = (
+    "emerg",
+    "alert",
+    "crit",
+    "err",
+    "warning",
+    "notice",
+    "info",
+    "debug",
+)
+
 # Severity name to numeric value mapping
-SEVERITY_MAP: dict[str, int] = {
-    "emerg": 0,
-    "alert": 1,
-    "crit": 2,
-    "err": 3,
-    "warning": 4,
-    "notice": 5,
-    "info": 6,
-    "debug": 7,
-}
+SEVERITY_MAP: dict[str, int] = {name: i for i, name in enumerate(SEVERITY_NAMES)}
+
+SEVERITY_REVERSE_MAP: Mapping[int, str] = MappingProxyType(dict(enumerate(SEVERITY_NAMES)))
+
+# Valid enum values, for the FilterMatch fast path
+_FACILITY_VALUES = frozenset(FACILITY_NAMES)
+_SEVERITY_VALUES = frozenset(SEVERITY_NAMES)
+
+
+# host:port, split at the last colon like rsplit(":", 1)
+_ADDRESS_RE = re.compile(r"(?P<host>.*):(?P<port>[0-9]+)", re.DOTALL)
+
+
+def _split_address(address: str) -> tuple[str, int]:
+    """Validate a 'host:port' address and return its parts."""
+    match = _ADDRESS_RE.fullmatch(address)
+    if match is None:
+        if ":" not in address:
+            raise ValueError("Address must be in format 'host:port'")
+        raise ValueError(f"Invalid port: {address.rsplit(':', 1)[1]!r}")
+    port = int(match["port"])
+    if not 1 <= port <= 65535:
+        raise ValueError("Invalid port: Port must be between 1 and 65535")
+    return match["host"], port
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_regex(pattern: str) -> re.Pattern:
+    """Compile a user-supplied regex, reporting errors as ValueError.
 
-SEVERITY_REVERSE_MAP: dict[int, str] = {v: k for k, v in SEVERITY_MAP.items()}
+    Memoized, so reloads and configs sharing a pattern reuse the compiled
+    object whatever else has churned the re module's own cache.
+    """
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid regex pattern: {e}") from e
+
+
+def required_literal(pattern: re.Pattern) -> str | None:
+    """Return the longest plain substring every match of the pattern must contain.
+
+    Taken from the parsed pattern, so escapes such as ``\\.``, ``\\x2d`` or
+    ``\\101`` count as the characters they match. Only top-level literal runs are
+    considered; groups, classes, repeats and alternation end a run, and
+    case-insensitive patterns yield None. A text without the literal cannot match,
+    so callers can rule a pattern out with a substring test.
+    """
+    if pattern.flags & re.IGNORECASE:
+        return None
+    try:
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    except re.error:
+        return None
+
+    longest = run = ""
+    for op, arg in parsed:
+        if op == _sre_parse.LITERAL:
+            run += chr(arg)
+            if len(run) > len(longest):
+                longest = run
+        else:
+            run = ""
+    return longest or None
 
 
 class InputConfig(BaseModel):
     """Configuration for a syslog input listener."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Unique name for this input")
     protocol: Protocol = Field(default=Protocol.UDP, description="Protocol to listen on")
     address: str = Field(default="0.0.0.0:514", description="Address to bind to (host:port)")
     format: SyslogFormat = Field(default=SyslogFormat.AUTO, description="Expected message format")
+    queue_size: int = Field(
+        default=10000, ge=1, description="UDP: datagrams buffered before new ones are dropped"
+    )
+    workers: int = Field(default=4, ge=1, le=64, description="UDP: concurrent message handlers")
+    sockets: int = Field(
+        default=1, ge=1, le=64, description="UDP: sockets bound to the address with SO_REUSEPORT"
+    )
+    reuse_port: bool = Field(
+        default=False, description="UDP: bind with SO_REUSEPORT so processes can share the port"
+    )
 
-    @field_validator("address")
-    @classmethod
-    def validate_address(cls, v: str) -> str:
-        """Validate address format (host:port)."""
-        if ":" not in v:
-            raise ValueError("Address must be in format 'host:port'")
-        host, port_str = v.rsplit(":", 1)
-        try:
-            port = int(port_str)
-            if not 1 <= port <= 65535:
-                raise ValueError("Port must be between 1 and 65535")
-        except ValueError as e:
-            raise ValueError(f"Invalid port: {e}") from e
-        return v
+    _host: str = PrivateAttr()
+    _port: int = PrivateAttr()
+
+    @model_validator(mode="after")
+    def validate_address(self) -> "InputConfig":
+        """Validate address format (host:port) and cache its parts."""
+        self._host, self._port = _split_address(self.address)
+        return self
 
     @property
     def host(self) -> str:
-        """Extract host from address."""
-        return self.address.rsplit(":", 1)[0]
+        """Host part of address."""
+        return self._host
 
     @property
     def port(self) -> int:
-        """Extract port from address."""
-        return int(self.address.rsplit(":", 1)[1])
+        """Port part of address."""
+        return self._port
 
 
 class FilterMatch(BaseModel):
     """Match criteria for a filter rule."""
 
+    model_config = ConfigDict(frozen=True)
+
     facility: list[Facility] | None = Field(default=None, description="Match these facilities")
     severity: list[Severity] | None = Field(default=None, description="Match these severities")
     hostname_pattern: str | None = Field(default=None, description="Regex pattern for hostname")
     message_pattern: str | None = Field(default=None, description="Regex pattern for message")
 
-    @field_validator("hostname_pattern", "message_pattern")
+    _hostname_regex: re.Pattern | None = PrivateAttr(default=None)
+    _message_regex: re.Pattern | None = PrivateAttr(default=None)
+
+    @field_validator("facility", mode="before")
+    @classmethod
+    def coerce_facility(cls, v: object) -> object:
+        """Map known facility names straight to enum members."""
+        if isinstance(v, list) and all(isinstance(f, str) and f in _FACILITY_VALUES for f in v):
+            return [Facility(f) for f in v]
+        return v
+
+    @field_validator("severity", mode="before")
     @classmethod
-    def validate_regex(cls, v: str | None) -> str | None:
-        """Validate regex patterns."""
-        if v is not None:
-            try:
-                re.compile(v)
-            except re.error as e:
-                raise ValueError(f"Invalid regex pattern: {e}") from e
+    def coerce_severity(cls, v: object) -> object:
+        """Map known severity names straight to enum members."""
+        if isinstance(v, list) and all(isinstance(s, str) and s in _SEVERITY_VALUES for s in v):
+            return [Severity(s) for s in v]
         return v
 
+    @model_validator(mode="after")
+    def validate_regex(self) -> "FilterMatch":
+        """Validate and compile regex patterns."""
+        if self.hostname_pattern is not None:
+            self._hostname_regex = _compile_regex(self.hostname_pattern)
+        if self.message_pattern is not None:
+            self._message_regex = _compile_regex(self.message_pattern)
+        return self
+
+    @property
+    def hostname_regex(self) -> re.Pattern | None:
+        """Compiled hostname pattern."""
+        return self._hostname_regex
+
+    @property
+    def message_regex(self) -> re.Pattern | None:
+        """Compiled message pattern."""
+        return self._message_regex
+
 
 class ReplaceConfig(BaseModel):
     """Configuration for regex replacement in messages."""
 
+    model_config = ConfigDict(frozen=True)
+
     pattern: str = Field(..., description="Regex pattern to match")
     replacement: str = Field(default="", description="Replacement string (supports \\1, \\2)")
 
-    @field_validator("pattern")
-    @classmethod
-    def validate_pattern(cls, v: str) -> str:
-        """Validate regex pattern."""
-        try:
-            re.compile(v)
-        except re.error as e:
-            raise ValueError(f"Invalid regex pattern: {e}") from e
-        return v
+    _regex: re.Pattern = PrivateAttr()
+
+    @model_validator(mode="after")
+    def validate_pattern(self) -> "ReplaceConfig":
+        """Validate and compile regex pattern."""
+        self._regex = _compile_regex(self.pattern)
+        return self
+
+    @property
+    def regex(self) -> re.Pattern:
+        """Compiled pattern."""
+        return self._regex
 
 
 class MaskConfig(BaseModel):
     """Configuration for masking sensitive data."""
 
+    model_config = ConfigDict(frozen=True)
+
     pattern: str = Field(..., description="Regex pattern to match sensitive data")
     replacement: str = Field(default="***MASKED***", description="Replacement text")
 
-    @field_validator("pattern")
-    @classmethod
-    def validate_pattern(cls, v: str) -> str:
-        """Validate regex pattern."""
-        try:
-            re.compile(v)
-        except re.error as e:
-            raise ValueError(f"Invalid regex pattern: {e}") from e
-        return v
+    _regex: re.Pattern = PrivateAttr()
+
+    @model_validator(mode="after")
+    def validate_pattern(self) -> "MaskConfig":
+        """Validate and compile regex pattern."""
+        self._regex = _compile_regex(self.pattern)
+        return self
+
+    @property
+    def regex(self) -> re.Pattern:
+        """Compiled pattern."""
+        return self._regex
 
 
 class TransformConfig(BaseModel):
     """Configuration for message transformation."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Unique name for this transformation")
     match_pattern: str | None = Field(
         default=None, description="Only apply to messages matching this regex"
@@ -229,16 +370,19 @@ class TransformConfig(BaseModel):
     message_prefix: str | None = Field(default=None, description="Prepend to message")
     message_suffix: str | None = Field(default=None, description="Append to message")
 
-    @field_validator("match_pattern")
-    @classmethod
-    def validate_match_pattern(cls, v: str | None) -> str | None:
-        """Validate match pattern."""
-        if v is not None:
-            try:
-                re.compile(v)
-            except re.error as e:
-                raise ValueError(f"Invalid regex pattern: {e}") from e
-        return v
+    _match_regex: re.Pattern | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def validate_match_pattern(self) -> "TransformConfig":
+        """Validate and compile match pattern."""
+        if self.match_pattern is not None:
+            self._match_regex = _compile_regex(self.match_pattern)
+        return self
+
+    @property
+    def match_regex(self) -> re.Pattern | None:
+        """Compiled match pattern."""
+        return self._match_regex
 
     @field_validator("remove_fields")
     @classmethod
@@ -253,10 +397,27 @@ class TransformConfig(BaseModel):
                     )
         return v
 
+    @field_validator("set_fields")
+    @classmethod
+    def validate_set_fields(cls, v: dict[str, str] | None) -> dict[str, str] | None:
+        """Validate that facility and severity are set to integers."""
+        if v:
+            for field in ("facility", "severity"):
+                if field in v:
+                    try:
+                        int(v[field])
+                    except ValueError:
+                        raise ValueError(
+                            f"Invalid {field} '{v[field]}'. Must be an integer"
+                        ) from None
+        return v
+
 
 class FilterConfig(BaseModel):
     """Configuration for a filter rule."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Unique name for this filter")
     match: FilterMatch | None = Field(default=None, description="Match criteria")
     action: Literal["forward", "drop"] = Field(default="forward", description="Action to take")
@@ -280,6 +441,8 @@ class FilterConfig(BaseModel):
 class RetryConfig(BaseModel):
     """Retry configuration for destinations."""
 
+    model_config = ConfigDict(frozen=True)
+
     max_attempts: int = Field(default=3, ge=1, le=10, description="Maximum retry attempts")
     backoff_seconds: float = Field(default=1.0, ge=0.1, le=60.0, description="Initial backoff")
 
@@ -287,58 +450,67 @@ class RetryConfig(BaseModel):
 class DestinationConfig(BaseModel):
     """Configuration for a forwarding destination."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Unique name for this destination")
     protocol: Protocol = Field(default=Protocol.UDP, description="Protocol to use")
     address: str = Field(..., description="Destination address (host:port)")
     format: SyslogFormat = Field(default=SyslogFormat.RFC5424, description="Output format")
     retry: RetryConfig = Field(default_factory=RetryConfig, description="Retry configuration")
 
-    @field_validator("address")
-    @classmethod
-    def validate_address(cls, v: str) -> str:
-        """Validate address format."""
-        if ":" not in v:
-            raise ValueError("Address must be in format 'host:port'")
-        _, port_str = v.rsplit(":", 1)
-        try:
-            port = int(port_str)
-            if not 1 <= port <= 65535:
-                raise ValueError("Port must be between 1 and 65535")
-        except ValueError as e:
-            raise ValueError(f"Invalid port: {e}") from e
-        return v
+    _host: str = PrivateAttr()
+    _port: int = PrivateAttr()
+
+    @model_validator(mode="after")
+    def validate_address(self) -> "DestinationConfig":
+        """Validate address format and cache its parts."""
+        self._host, self._port = _split_address(self.address)
+        return self
 
     @property
     def host(self) -> str:
-        """Extract host from address."""
-        return self.address.rsplit(":", 1)[0]
+        """Host part of address."""
+        return self._host
 
     @property
     def port(self) -> int:
-        """Extract port from address."""
-        return int(self.address.rsplit(":", 1)[1])
+        """Port part of address."""
+        return self._port
 
 
 class MetricsConfig(BaseModel):
     """Prometheus metrics configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = Field(default=True, description="Enable metrics endpoint")
     address: str = Field(default="0.0.0.0:9090", description="Metrics endpoint address")
 
+    _host: str = PrivateAttr()
+    _port: int = PrivateAttr()
+
+    @model_validator(mode="after")
+    def validate_address(self) -> "MetricsConfig":
+        """Validate address format and cache its parts."""
+        self._host, self._port = _split_address(self.address)
+        return self
+
     @property
     def host(self) -> str:
-        """Extract host from address."""
-        return self.address.rsplit(":", 1)[0]
+        """Host part of address."""
+        return self._host
 
     @property
     def port(self) -> int:
-        """Extract port from address."""
-        return int(self.address.rsplit(":", 1)[1])
+        """Port part of address."""
+        return self._port
 
 
 class ServiceConfig(BaseModel):
     """Service-level configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     log_level: Literal["debug", "info", "warning", "error"] = Field(
         default="info", description="Logging level"
     )
@@ -348,6 +520,9 @@ class ServiceConfig(BaseModel):
 class Config(BaseModel):
     """Root configuration for syslog-fwd."""
 
+    # Loaded configs are memoized and shared by reference between components
+    model_config = ConfigDict(frozen=True)
+
     version: Annotated[str, Field(pattern=r"^\d+$")] = Field(
         default="1", description="Config schema version"
     )
@@ -364,49 +539,159 @@ class Config(BaseModel):
     @model_validator(mode="after")
     def validate_references(self) -> "Config":
         """Validate that all referenced destinations and transforms exist."""
-        dest_names = {d.name for d in self.destinations}
-        transform_names = {t.name for t in self.transforms}
+        dest_names = frozenset(d.name for d in self.destinations)
+        transform_names = frozenset(t.name for t in self.transforms)
 
+        missing_dests = set().union(*(f.destinations or () for f in self.filters)) - dest_names
+        missing_transforms = (
+            set().union(*(f.transforms or () for f in self.filters)) - transform_names
+        )
+        if not missing_dests and not missing_transforms:
+            return self
+
+        # Report the first offending filter, in config order
         for f in self.filters:
-            # Validate destination references
-            if f.destinations:
-                for dest in f.destinations:
-                    if dest not in dest_names:
-                        raise ValueError(
-                            f"Filter '{f.name}' references unknown destination '{dest}'"
-                        )
-            # Validate transform references
-            if f.transforms:
-                for transform in f.transforms:
-                    if transform not in transform_names:
-                        raise ValueError(
-                            f"Filter '{f.name}' references unknown transform '{transform}'"
-                        )
+            for dest in f.destinations or ():
+                if dest in missing_dests:
+                    raise ValueError(
+                        f"Filter '{f.name}' references unknown destination '{dest}'"
+                    )
+            for transform in f.transforms or ():
+                if transform in missing_transforms:
+                    raise ValueError(
+                        f"Filter '{f.name}' references unknown transform '{transform}'"
+                    )
         return self
 
 
+# Built once so load_config goes straight into pydantic-core
+_CONFIG_ADAPTER: TypeAdapter[Config] = TypeAdapter(Config)
+
+
+# ${VAR} or ${VAR:-default}
+_ENV_VAR_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}")
+
+
 def _substitute_env_vars(content: str) -> str:
     """Substitute ${VAR} and ${VAR:-default} patterns with environment variables."""
-    pattern = r"\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}"
+    if "${" not in content:
+        return content
+
+    # Plain dict lookups instead of decoding through os.environ on every match
+    env = dict(os.environ)
 
     def replace(match: re.Match) -> str:
-        var_name = match.group(1)
-        default = match.group(2)
-        value = os.environ.get(var_name)
+        var_name = match[1]
+        default = match[2]
+        value = env.get(var_name)
         if value is not None:
             return value
         if default is not None:
             return default
-        return match.group(0)  # Keep original if no value and no default
+        return match[0]  # Keep original if no value and no default
+
+    return _ENV_VAR_RE.sub(replace, content)
+
 
-    return re.sub(pattern, replace, content)
+def _cache_dir() -> Path | None:
+    """Directory holding validated config snapshots ($XDG_CACHE_HOME/syslog-fwd).
+
+    None when there is neither XDG_CACHE_HOME nor a home directory, e.g. for an
+    arbitrary container UID without HOME.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except RuntimeError:
+            return None
+    return Path(base) / "syslog-fwd"
+
+
+def _cache_paths(cache_dir: Path, path: Path, content: bytes) -> tuple[Path, bytes]:
+    """Return the cache file for a config path and the key for its current content.
+
+    The key covers the package version and the env-substituted content, so both
+    file edits and environment changes invalidate the cached entry.
+    """
+    name = hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:32]
+    key = hashlib.sha256(f"{__version__}\0".encode() + content).hexdigest().encode()
+    return cache_dir / f"{name}.json", key
+
+
+def _read_cached_config(cache_file: Path, key: bytes) -> Config | None:
+    """Load a cached Config, or None on miss, stale key or unreadable entry."""
+    try:
+        cached_key, _, payload = cache_file.read_bytes().partition(b"\n")
+    except OSError:
+        return None
+    if cached_key != key:
+        return None
+    try:
+        return _CONFIG_ADAPTER.validate_json(payload)
+    except ValidationError:
+        return None
 
 
-def load_config(path: str | Path) -> Config:
+def _write_cached_config(cache_file: Path, key: bytes, config: Config) -> None:
+    """Atomically store a validated Config, readable by the owner only; failures are ignored."""
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            os.chmod(tmp_name, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(key + b"\n" + config.model_dump_json().encode())
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+def _parse_config(content: bytes) -> Config:
+    """Parse and validate env-substituted YAML content."""
+    try:
+        data = yaml.load(content, Loader=_YamlLoader)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML: {e}") from e
+
+    if data is None:
+        data = {}
+
+    return _CONFIG_ADAPTER.validate_python(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path_str: str, content: bytes, persist: bool = True) -> Config:
+    """Load a Config, memoized per process and, if persist, through the on-disk cache."""
+    cache_dir = _cache_dir() if persist else None
+    if cache_dir is None:
+        return _parse_config(content)
+
+    cache_file, key = _cache_paths(cache_dir, Path(path_str), content)
+    cached = _read_cached_config(cache_file, key)
+    if cached is not None:
+        return cached
+
+    config = _parse_config(content)
+    _write_cached_config(cache_file, key, config)
+    return config
+
+
+def load_config(path: str | Path, use_cache: bool = True) -> Config:
     """Load configuration from a YAML file.
 
+    Validated configurations are cached under ``$XDG_CACHE_HOME/syslog-fwd`` so
+    that unchanged files skip YAML parsing on subsequent loads, and memoized in
+    process so repeated loads of an unchanged file return the same object. Files
+    whose text changes under environment variable substitution are not cached on
+    disk, since the expanded values may be secrets.
+
     Args:
         path: Path to the YAML configuration file.
+        use_cache: Use the in-process and on-disk config caches.
 
     Returns:
         Validated Config object.
@@ -419,15 +704,15 @@ def load_config(path: str | Path) -> Config:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
-    content = path.read_text()
-    content = _substitute_env_vars(content)
-
-    try:
-        data = yaml.safe_load(content)
-    except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML: {e}") from e
-
-    if data is None:
-        data = {}
-
-    return Config.model_validate(data)
+    # libyaml reads the bytes directly; only decode when there is something to substitute
+    content = path.read_bytes()
+    persist = True
+    if b"${" in content:
+        substituted = _substitute_env_vars(content.decode("utf-8")).encode("utf-8")
+        # Expanded values never reach the on-disk cache
+        persist = substituted == content
+        content = substituted
+
+    if use_cache:
+        return _load_config_cached(str(path.resolve()), content, persist)
+    return _parse_config(content)
@@ -1,5 +1,6 @@
 """Export syslog-fwd configuration to syslog-ng format."""
 
+import io
 from datetime import datetime
 
 from .config import (
@@ -15,17 +16,15 @@ from .config import (
 )
 
 
-def _escape_syslogng_string(s: str) -> str:
-    """Escape a string for syslog-ng configuration."""
-    return s.replace("\\", "\\\\").replace('"', '\\"')
+# Backslash and double quote, escaped in a single pass
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
 
 
-def _generate_header(config: Config) -> str:
-    """Generate syslog-ng config header."""
-    return f"""#
-# syslog-ng configuration
-# Generated from syslog-fwd config on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-#
+# Rule line framing each section heading
+_SECTION_RULE = "# " + "=" * 70 + "\n"
+
+# Header lines following the generation timestamp; they do not vary between exports
+_HEADER_BODY = """#
 # WARNING: This is an auto-generated configuration.
 # Some features may require manual adjustment.
 #
@@ -34,7 +33,7 @@ def _generate_header(config: Config) -> str:
 @include "scl.conf"
 
 # Global options
-options {{
+options {
     time-reap(30);
     mark-freq(10);
     keep-hostname(yes);
@@ -44,14 +43,44 @@ options {{
     use-fqdn(no);
     create-dirs(yes);
     keep-timestamp(yes);
-}};
+};
 
 """
 
 
-def _generate_source(inp: InputConfig, index: int) -> str:
+def _section_heading(title: str) -> str:
+    """Build a framed section heading."""
+    return f"{_SECTION_RULE}# {title}\n{_SECTION_RULE}\n"
+
+
+_SECTION_SOURCES = _section_heading("Sources")
+_SECTION_DESTINATIONS = _section_heading("Destinations")
+_SECTION_REWRITES = _section_heading("Rewrites (transforms)")
+_SECTION_FILTERS = _section_heading("Filters")
+_SECTION_LOG_PATHS = _section_heading("Log paths")
+
+
+def _escape_syslogng_string(s: str) -> str:
+    """Escape a string for syslog-ng configuration."""
+    return s.translate(_ESCAPE_TABLE)
+
+
+def _sanitize_name(name: str) -> str:
+    """Turn a syslog-fwd object name into a syslog-ng identifier suffix."""
+    return name.replace("-", "_")
+
+
+def _generate_header(config: Config) -> str:
+    """Generate syslog-ng config header."""
+    return (
+        "#\n# syslog-ng configuration\n"
+        f"# Generated from syslog-fwd config on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        + _HEADER_BODY
+    )
+
+
+def _generate_source(inp: InputConfig, source_name: str) -> str:
     """Generate syslog-ng source block for an input."""
-    source_name = f"s_{inp.name.replace('-', '_')}"
     host = inp.host if inp.host != "0.0.0.0" else ""
     port = inp.port
 
@@ -78,9 +107,8 @@ source {source_name} {{
 """
 
 
-def _generate_destination(dest: DestinationConfig, index: int) -> str:
+def _generate_destination(dest: DestinationConfig, dest_name: str) -> str:
     """Generate syslog-ng destination block."""
-    dest_name = f"d_{dest.name.replace('-', '_')}"
     host = dest.host
     port = dest.port
 
@@ -111,9 +139,8 @@ destination {dest_name} {{
 """
 
 
-def _generate_rewrite(transform: TransformConfig, index: int) -> str:
+def _generate_rewrite(transform: TransformConfig, rewrite_name: str) -> str:
     """Generate syslog-ng rewrite rules for a transform."""
-    rewrite_name = f"r_{transform.name.replace('-', '_')}"
     rules: list[str] = []
 
     # Message prefix
@@ -178,9 +205,10 @@ rewrite {rewrite_name} {{
 """
 
 
-def _generate_filter(flt: FilterConfig, transforms: dict[str, TransformConfig], index: int) -> str:
+def _generate_filter(
+    flt: FilterConfig, transforms: dict[str, TransformConfig], filter_name: str
+) -> str:
     """Generate syslog-ng filter block."""
-    filter_name = f"f_{flt.name.replace('-', '_')}"
     conditions: list[str] = []
 
     if flt.match:
@@ -236,27 +264,22 @@ def _generate_log_paths(
     filters: dict[str, str],
     destinations: dict[str, str],
     rewrites: dict[str, str],
+    sanitized: dict[str, str],
 ) -> str:
     """Generate syslog-ng log paths."""
-    output: list[str] = []
-    output.append("# Log paths\n")
+    output = io.StringIO()
+    output.write("# Log paths\n")
 
-    # Create transform name to rewrite name mapping
-    # rewrites dict has rewrite_name -> transform_name, we need the inverse
-    rewrite_name_to_transform = {v: k for k, v in rewrites.items()}
+    # Transform name -> rewrite name, for transforms that produced a rewrite block
     transform_to_rewrite = {
-        transform_name: rewrite_name
-        for transform_name, rewrite_name in [
-            (t.name, f"r_{t.name.replace('-', '_')}") for t in config.transforms
-        ]
-        if rewrite_name in rewrites
+        transform_name: rewrite_name for rewrite_name, transform_name in rewrites.items()
     }
 
-    for flt in config.filters:
-        filter_name = f"f_{flt.name.replace('-', '_')}"
+    # Build source list once (all sources for simplicity)
+    source_refs = " ".join([f"source({s});" for s in sources.keys()])
 
-        # Build source list (all sources for simplicity)
-        source_refs = " ".join([f"source({s});" for s in sources.keys()])
+    for flt in config.filters:
+        filter_name = f"f_{sanitized[flt.name]}"
 
         # Filter reference
         filter_ref = f"filter({filter_name});"
@@ -270,7 +293,7 @@ def _generate_log_paths(
 
         if flt.action == "drop":
             # Drop action - log to null
-            output.append(f"""# Log path: {flt.name} (DROP)
+            output.write(f"""# Log path: {flt.name} (DROP)
 log {{
     {source_refs}
     {filter_ref}
@@ -282,11 +305,11 @@ log {{
             # Forward action
             if flt.destinations:
                 dest_refs = " ".join([
-                    f"destination(d_{d.replace('-', '_')});"
+                    f"destination(d_{sanitized[d]});"
                     for d in flt.destinations
                 ])
                 rewrite_line = f"\n    {rewrite_refs}" if rewrite_refs else ""
-                output.append(f"""# Log path: {flt.name}
+                output.write(f"""# Log path: {flt.name}
 log {{
     {source_refs}
     {filter_ref}{rewrite_line}
@@ -296,7 +319,7 @@ log {{
 
 """)
 
-    return "".join(output)
+    return output.getvalue()
 
 
 def export_to_syslogng(config: Config) -> str:
@@ -308,10 +331,18 @@ def export_to_syslogng(config: Config) -> str:
     Returns:
         A string containing the syslog-ng configuration.
     """
-    output: list[str] = []
+    # All sections are rendered into one buffer and materialized once at the end
+    output = io.StringIO()
 
     # Header
-    output.append(_generate_header(config))
+    output.write(_generate_header(config))
+
+    # Sanitize every object name once; generators and log paths share the lookup
+    sanitized = {
+        obj.name: _sanitize_name(obj.name)
+        for objs in (config.inputs, config.destinations, config.transforms, config.filters)
+        for obj in objs
+    }
 
     # Track generated names
     sources: dict[str, str] = {}
@@ -321,57 +352,47 @@ def export_to_syslogng(config: Config) -> str:
 
     # Generate sources
     if config.inputs:
-        output.append("# " + "=" * 70 + "\n")
-        output.append("# Sources\n")
-        output.append("# " + "=" * 70 + "\n\n")
-        for i, inp in enumerate(config.inputs):
-            source_name = f"s_{inp.name.replace('-', '_')}"
+        output.write(_SECTION_SOURCES)
+        for inp in config.inputs:
+            source_name = f"s_{sanitized[inp.name]}"
             sources[source_name] = inp.name
-            output.append(_generate_source(inp, i))
+            output.write(_generate_source(inp, source_name))
 
     # Generate destinations
     if config.destinations:
-        output.append("# " + "=" * 70 + "\n")
-        output.append("# Destinations\n")
-        output.append("# " + "=" * 70 + "\n\n")
-        for i, dest in enumerate(config.destinations):
-            dest_name = f"d_{dest.name.replace('-', '_')}"
+        output.write(_SECTION_DESTINATIONS)
+        for dest in config.destinations:
+            dest_name = f"d_{sanitized[dest.name]}"
             destinations[dest_name] = dest.name
-            output.append(_generate_destination(dest, i))
+            output.write(_generate_destination(dest, dest_name))
 
     # Generate rewrites from transforms
     if config.transforms:
         has_rewrites = False
-        rewrite_output: list[str] = []
-        for i, transform in enumerate(config.transforms):
-            rewrite_str = _generate_rewrite(transform, i)
+        for transform in config.transforms:
+            rewrite_name = f"r_{sanitized[transform.name]}"
+            rewrite_str = _generate_rewrite(transform, rewrite_name)
             if rewrite_str:
                 if not has_rewrites:
-                    rewrite_output.append("# " + "=" * 70 + "\n")
-                    rewrite_output.append("# Rewrites (transforms)\n")
-                    rewrite_output.append("# " + "=" * 70 + "\n\n")
+                    output.write(_SECTION_REWRITES)
                     has_rewrites = True
-                rewrite_name = f"r_{transform.name.replace('-', '_')}"
                 rewrites[rewrite_name] = transform.name
-                rewrite_output.append(rewrite_str)
-        output.extend(rewrite_output)
+                output.write(rewrite_str)
 
     # Generate filters
     if config.filters:
-        output.append("# " + "=" * 70 + "\n")
-        output.append("# Filters\n")
-        output.append("# " + "=" * 70 + "\n\n")
+        output.write(_SECTION_FILTERS)
         transform_dict = {t.name: t for t in config.transforms}
-        for i, flt in enumerate(config.filters):
-            filter_name = f"f_{flt.name.replace('-', '_')}"
+        for flt in config.filters:
+            filter_name = f"f_{sanitized[flt.name]}"
             filters[filter_name] = flt.name
-            output.append(_generate_filter(flt, transform_dict, i))
+            output.write(_generate_filter(flt, transform_dict, filter_name))
 
     # Generate log paths
     if config.filters:
-        output.append("# " + "=" * 70 + "\n")
-        output.append("# Log paths\n")
-        output.append("# " + "=" * 70 + "\n\n")
-        output.append(_generate_log_paths(config, sources, filters, destinations, rewrites))
+        output.write(_SECTION_LOG_PATHS)
+        output.write(
+            _generate_log_paths(config, sources, filters, destinations, rewrites, sanitized)
+        )
 
-    return "".join(output)
+    return output.getvalue()
@@ -2,20 +2,55 @@
 
 import re
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 import structlog
+from prometheus_client import Counter, Histogram
 
-from .config import FACILITY_MAP, SEVERITY_MAP, FilterConfig
+from .config import FACILITY_MAP, SEVERITY_MAP, FilterConfig, required_literal
 from .metrics import MESSAGES_DROPPED, PROCESSING_LATENCY
 from .parser import SyslogMessage
 
 logger = structlog.get_logger()
 
+# Filter latency is observed on one message in this many
+LATENCY_SAMPLE_INTERVAL = 64
 
-@dataclass
+# Characters that give a pattern regex semantics; without them it is a plain substring
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _literal(pattern: str | None) -> str | None:
+    """Return the pattern if searching for it is a plain substring test."""
+    if pattern and not _REGEX_METACHARS.intersection(pattern):
+        return pattern
+    return None
+
+
+# Hostnames whose first matching filter is cached, across all (facility, severity)
+# pairs; hostnames come from the network, so longer than RFC 5424 allows are not
+MAX_CACHED_HOSTNAMES = 8192
+MAX_CACHED_HOSTNAME_LENGTH = 255
+
+# Facility/severity mask for filters without that criterion: every bit set
+_ANY = -1
+
+
+def _mask(values: Iterable[int]) -> int:
+    """Build a bitmask with bit ``n`` set for each value ``n``."""
+    mask = 0
+    for n in values:
+        mask |= 1 << n
+    return mask
+
+
+@dataclass(slots=True, frozen=True)
 class FilterResult:
-    """Result of filter evaluation."""
+    """Result of filter evaluation.
+
+    Results are built once per filter and shared between messages.
+    """
 
     matched: bool
     filter_name: str | None
@@ -24,31 +59,135 @@ class FilterResult:
     transforms: list[str] | None = None
 
 
+# Returned when no filter matches - drop by default
+_NO_MATCH_RESULT = FilterResult(matched=False, filter_name=None, action="drop", destinations=[])
+
+
+@dataclass(slots=True)
+class _CompiledFilter:
+    """A filter with its match criteria prepared for evaluation."""
+
+    config: FilterConfig
+    facility_mask: int  # Bit n set when facility n matches
+    severity_mask: int  # Bit n set when severity n matches
+    hostname_pattern: re.Pattern | None
+    message_pattern: re.Pattern | None
+    hostname_literal: str | None
+    message_literal: str | None
+    hostname_required: str | None  # Substring any hostname_pattern match contains
+    message_required: str | None  # Substring any message_pattern match contains
+    inspects_content: bool  # Has hostname or message criteria
+    inspects_message: bool  # Has message criteria
+    latency: Histogram  # PROCESSING_LATENCY child for this filter
+    dropped: Counter | None  # MESSAGES_DROPPED child, for drop filters
+    result: FilterResult  # Returned for every message this filter matches
+
+
+@dataclass(slots=True)
+class _Decision:
+    """What the filters resolve to for one (facility, severity) pair."""
+
+    candidates: tuple[_CompiledFilter, ...]  # Filters that can still match, in order
+    # hostname -> first matching filter, when no candidate inspects the message
+    by_hostname: dict[str | None, _CompiledFilter | None] | None
+
+
 class FilterEngine:
     """Engine for evaluating filter rules against syslog messages."""
 
-    def __init__(self, filters: list[FilterConfig]) -> None:
+    def __init__(self, filters: list[FilterConfig], record_latency: bool = True) -> None:
         """Initialize filter engine.
 
         Args:
             filters: List of filter configurations.
+            record_latency: Whether to sample PROCESSING_LATENCY; off when metrics
+                are not served.
         """
         self.filters = filters
-        self._compiled_patterns: dict[str, tuple[re.Pattern | None, re.Pattern | None]] = {}
+        self._record_latency = record_latency
+        self._sample_latency = False
+        self._compiled: list[_CompiledFilter] = []
+        self._decisions: dict[tuple[int, int], _Decision] = {}
+        self._cached_hostnames = 0
+        self._no_match_latency = PROCESSING_LATENCY.labels(filter="none")
+        self._no_match_dropped = MESSAGES_DROPPED.labels(reason="no_match")
+        self._eval_count = 0
         self._compile_patterns()
         self.log = logger.bind(component="filter_engine")
 
     def _compile_patterns(self) -> None:
-        """Pre-compile regex patterns for performance."""
+        """Prepare per-filter match criteria, in filter order."""
+        self._compiled = []
+        self._decisions = {}
+        self._cached_hostnames = 0
+        # Without filters there is nothing worth timing
+        self._sample_latency = self._record_latency and bool(self.filters)
         for f in self.filters:
+            match = f.match
+            facility_mask = _ANY
+            severity_mask = _ANY
+            if match and match.facility:
+                facility_mask = _mask(FACILITY_MAP[fac.value] for fac in match.facility)
+            if match and match.severity:
+                severity_mask = _mask(SEVERITY_MAP[sev.value] for sev in match.severity)
+
+            # Literal patterns use str containment; empty patterns are not checked
+            hostname_literal = _literal(match.hostname_pattern) if match else None
+            message_literal = _literal(match.message_pattern) if match else None
             hostname_pattern = None
             message_pattern = None
-            if f.match:
-                if f.match.hostname_pattern:
-                    hostname_pattern = re.compile(f.match.hostname_pattern)
-                if f.match.message_pattern:
-                    message_pattern = re.compile(f.match.message_pattern)
-            self._compiled_patterns[f.name] = (hostname_pattern, message_pattern)
+            if match and match.hostname_pattern and hostname_literal is None:
+                hostname_pattern = match.hostname_regex
+            if match and match.message_pattern and message_literal is None:
+                message_pattern = match.message_regex
+
+            self._compiled.append(
+                _CompiledFilter(
+                    config=f,
+                    facility_mask=facility_mask,
+                    severity_mask=severity_mask,
+                    hostname_pattern=hostname_pattern,
+                    message_pattern=message_pattern,
+                    hostname_literal=hostname_literal,
+                    message_literal=message_literal,
+                    hostname_required=(
+                        required_literal(hostname_pattern) if hostname_pattern else None
+                    ),
+                    message_required=(
+                        required_literal(message_pattern) if message_pattern else None
+                    ),
+                    inspects_content=bool(
+                        hostname_pattern
+                        or message_pattern
+                        or hostname_literal is not None
+                        or message_literal is not None
+                    ),
+                    inspects_message=bool(message_pattern or message_literal is not None),
+                    latency=PROCESSING_LATENCY.labels(filter=f.name),
+                    dropped=(
+                        MESSAGES_DROPPED.labels(reason=f"filter:{f.name}")
+                        if f.action == "drop"
+                        else None
+                    ),
+                    result=(
+                        FilterResult(
+                            matched=True,
+                            filter_name=f.name,
+                            action="drop",
+                            destinations=[],
+                            transforms=None,
+                        )
+                        if f.action == "drop"
+                        else FilterResult(
+                            matched=True,
+                            filter_name=f.name,
+                            action="forward",
+                            destinations=f.destinations or [],
+                            transforms=f.transforms,
+                        )
+                    ),
+                )
+            )
 
     def evaluate(self, message: SyslogMessage) -> FilterResult:
         """Evaluate a message against all filters.
@@ -61,86 +200,135 @@ class FilterEngine:
         Returns:
             FilterResult with match information.
         """
-        start_time = time.perf_counter()
-
-        for f in self.filters:
-            if self._matches(f, message):
-                elapsed = time.perf_counter() - start_time
-                PROCESSING_LATENCY.labels(filter=f.name).observe(elapsed)
-
-                if f.action == "drop":
-                    MESSAGES_DROPPED.labels(reason=f"filter:{f.name}").inc()
-                    return FilterResult(
-                        matched=True,
-                        filter_name=f.name,
-                        action="drop",
-                        destinations=[],
-                        transforms=None,
-                    )
-
-                return FilterResult(
-                    matched=True,
-                    filter_name=f.name,
-                    action="forward",
-                    destinations=f.destinations or [],
-                    transforms=f.transforms,
-                )
+        self._eval_count += 1
+        sampled = self._sample_latency and self._eval_count % LATENCY_SAMPLE_INTERVAL == 0
+        start_time = time.perf_counter() if sampled else 0.0
+
+        compiled = self._find_match(message)
+        if compiled is not None:
+            if sampled:
+                compiled.latency.observe(time.perf_counter() - start_time)
+            if compiled.dropped is not None:
+                compiled.dropped.inc()
+            return compiled.result
 
         # No filter matched - drop by default
-        elapsed = time.perf_counter() - start_time
-        PROCESSING_LATENCY.labels(filter="none").observe(elapsed)
-        MESSAGES_DROPPED.labels(reason="no_match").inc()
+        if sampled:
+            self._no_match_latency.observe(time.perf_counter() - start_time)
+        self._no_match_dropped.inc()
+        return _NO_MATCH_RESULT
 
-        return FilterResult(
-            matched=False,
-            filter_name=None,
-            action="drop",
-            destinations=[],
-        )
+    def _find_match(self, message: SyslogMessage) -> _CompiledFilter | None:
+        """Find the first matching filter.
 
-    def _matches(self, filter_config: FilterConfig, message: SyslogMessage) -> bool:
-        """Check if a message matches a filter's criteria.
+        Filters are specialized per (facility, severity): the first time a pair is
+        seen, the filters it can satisfy are resolved once, ending at the first one
+        with no hostname or message criteria. Later messages only run the content
+        checks of those candidates. When none of them looks at the message text,
+        the outcome depends on the hostname alone and is cached per hostname.
 
         Args:
-            filter_config: Filter configuration.
             message: Parsed syslog message.
 
         Returns:
-            True if the message matches all criteria.
+            The first matching compiled filter, or None.
         """
-        # No match criteria = match everything (catch-all filter)
-        if filter_config.match is None:
-            return True
+        key = (message.facility, message.severity)
+        decision = self._decisions.get(key)
+        if decision is None:
+            decision = self._decide(*key)
+            self._decisions[key] = decision
+
+        by_hostname = decision.by_hostname
+        if by_hostname is not None:
+            hostname = message.hostname
+            if hostname in by_hostname:
+                return by_hostname[hostname]
+
+        found = None
+        for compiled in decision.candidates:
+            if not compiled.inspects_content or self._content_matches(compiled, message):
+                found = compiled
+                break
+
+        if (
+            by_hostname is not None
+            and self._cached_hostnames < MAX_CACHED_HOSTNAMES
+            and (hostname is None or len(hostname) <= MAX_CACHED_HOSTNAME_LENGTH)
+        ):
+            by_hostname[hostname] = found
+            self._cached_hostnames += 1
+        return found
+
+    def _decide(self, facility: int, severity: int) -> _Decision:
+        """Resolve the candidate filters for a pair and whether to cache by hostname."""
+        candidates = self._candidates(facility, severity)
+        by_hostname = None
+        if any(c.inspects_content for c in candidates) and not any(
+            c.inspects_message for c in candidates
+        ):
+            by_hostname = {}
+        return _Decision(candidates=candidates, by_hostname=by_hostname)
+
+    def _candidates(self, facility: int, severity: int) -> tuple[_CompiledFilter, ...]:
+        """Resolve which filters can match a facility and severity, in order.
 
-        match = filter_config.match
-
-        # Check facility
-        if match.facility:
-            facility_values = {FACILITY_MAP[f.value] for f in match.facility}
-            if message.facility not in facility_values:
-                return False
+        Returns:
+            Matching filters up to and including the first that does not inspect
+            message content; empty if no filter can match.
+        """
+        candidates = []
+        for compiled in self._compiled:
+            if not (compiled.facility_mask >> facility) & 1:
+                continue
+            if not (compiled.severity_mask >> severity) & 1:
+                continue
+            candidates.append(compiled)
+            if not compiled.inspects_content:
+                break
+        return tuple(candidates)
+
+    def _content_matches(self, compiled: _CompiledFilter, message: SyslogMessage) -> bool:
+        """Check a message against a filter's hostname and message criteria.
+
+        Facility and severity are already satisfied by candidate selection.
 
-        # Check severity
-        if match.severity:
-            severity_values = {SEVERITY_MAP[s.value] for s in match.severity}
-            if message.severity not in severity_values:
-                return False
+        Args:
+            compiled: Compiled filter.
+            message: Parsed syslog message.
 
+        Returns:
+            True if the message matches all criteria.
+        """
         # Check hostname pattern
-        hostname_pattern, message_pattern = self._compiled_patterns.get(
-            filter_config.name, (None, None)
-        )
+        hostname_pattern = compiled.hostname_pattern
+        hostname_literal = compiled.hostname_literal
 
-        if hostname_pattern and message.hostname:
-            if not hostname_pattern.search(message.hostname):
+        if hostname_pattern or hostname_literal is not None:
+            hostname = message.hostname
+            if not hostname:
+                # Filter requires hostname but message has none
                 return False
-        elif hostname_pattern and not message.hostname:
-            # Filter requires hostname but message has none
-            return False
+            if hostname_literal is not None:
+                if hostname_literal not in hostname:
+                    return False
+            else:
+                # Cheap substring rejection before running the regex
+                required = compiled.hostname_required
+                if required is not None and required not in hostname:
+                    return False
+                if not hostname_pattern.search(hostname):
+                    return False
 
         # Check message pattern
-        if message_pattern:
-            if not message_pattern.search(message.message):
+        if compiled.message_literal is not None:
+            if compiled.message_literal not in message.message:
+                return False
+        elif compiled.message_pattern:
+            required = compiled.message_required
+            if required is not None and required not in message.message:
+                return False
+            if not compiled.message_pattern.search(message.message):
                 return False
 
         return True
@@ -152,6 +340,5 @@ class FilterEngine:
             filters: New filter configurations.
         """
         self.filters = filters
-        self._compiled_patterns.clear()
         self._compile_patterns()
         self.log.info("Filters reloaded", count=len(filters))
@@ -17,6 +17,15 @@ from .transformer import MessageTransformer
 
 logger = structlog.get_logger()
 
+# Complete /health reply, written as-is instead of formatting status and headers per probe
+_HEALTH_RESPONSE = (
+    b"HTTP/1.0 200 OK\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"Content-Length: 2\r\n"
+    b"\r\n"
+    b"OK"
+)
+
 
 class SyslogForwarder:
     """Main syslog forwarder service."""
@@ -32,12 +41,15 @@ class SyslogForwarder:
 
         # Initialize components
         self.transformer = MessageTransformer(config.transforms)
-        self.filter_engine = FilterEngine(config.filters)
+        self.filter_engine = FilterEngine(
+            config.filters, record_latency=config.service.metrics.enabled
+        )
         self.inputs: list[BaseInput] = []
         self.outputs: dict[str, BaseOutput] = {}
 
         # Create message handler
-        handler: MessageHandler = self._handle_message
+        self._handle_message: MessageHandler = self._make_message_handler()
+        handler = self._handle_message
 
         # Create inputs
         for input_config in config.inputs:
@@ -51,41 +63,85 @@ class SyslogForwarder:
         self._metrics_server: HTTPServer | None = None
         self._metrics_thread: Thread | None = None
 
-    async def _handle_message(self, message: SyslogMessage) -> None:
-        """Handle a received syslog message.
+    def _make_message_handler(self) -> MessageHandler:
+        """Build the per-message handler used by all inputs.
 
-        Args:
-            message: Parsed syslog message.
+        Collaborators are bound as closure variables once, so the per-message
+        path reads locals instead of repeating attribute lookups on self.
+
+        Returns:
+            Async callback handling one parsed syslog message.
         """
-        # Evaluate filters
-        result = self.filter_engine.evaluate(message)
-
-        if result.action == "drop":
-            self.log.debug(
-                "Message dropped",
-                filter=result.filter_name,
-                facility=message.facility_name,
-                severity=message.severity_name,
-            )
-            return
-
-        # Apply transformations if specified in the filter
-        transformed_message = message
-        if result.transforms:
-            transformed_message = self.transformer.transform(message, result.transforms)
-
-        # Forward to destinations
-        for dest_name in result.destinations:
-            output = self.outputs.get(dest_name)
-            if output:
-                success = await output.send_with_retry(transformed_message)
-                if not success:
-                    self.log.warning(
+        evaluate = self.filter_engine.evaluate
+        transform = self.transformer.transform
+        outputs = self.outputs
+        log = self.log
+        gather = asyncio.gather
+
+        async def handle_message(message: SyslogMessage) -> None:
+            """Handle a received syslog message.
+
+            Args:
+                message: Parsed syslog message.
+            """
+            # Evaluate filters
+            result = evaluate(message)
+
+            if result.action == "drop":
+                log.debug(
+                    "Message dropped",
+                    filter=result.filter_name,
+                    facility=message.facility_name,
+                    severity=message.severity_name,
+                )
+                return
+
+            # Apply transformations if specified in the filter
+            transformed_message = message
+            if result.transforms:
+                transformed_message = transform(message, result.transforms)
+
+            # Forward to destinations; fan-out sends run concurrently
+            targets = [
+                (dest_name, outputs[dest_name])
+                for dest_name in result.destinations
+                if dest_name in outputs
+            ]
+            # A destination raising is reported like one returning False, whether it
+            # was sent alone or alongside others
+            outcomes: list[bool | BaseException]
+            if len(targets) == 1:
+                try:
+                    outcomes = [await targets[0][1].send_with_retry(transformed_message)]
+                except Exception as e:
+                    outcomes = [e]
+            else:
+                outcomes = await gather(
+                    *(output.send_with_retry(transformed_message) for _, output in targets),
+                    return_exceptions=True,
+                )
+
+            for (dest_name, _), outcome in zip(targets, outcomes):
+                if outcome is True:
+                    continue
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, Exception):
+                        raise outcome  # Cancellation and exits are not send failures
+                    log.error(
+                        "Error forwarding message",
+                        destination=dest_name,
+                        facility=message.facility_name,
+                        error=str(outcome),
+                    )
+                else:
+                    log.warning(
                         "Failed to forward message",
                         destination=dest_name,
                         facility=message.facility_name,
                     )
 
+        return handle_message
+
     async def start(self) -> None:
         """Start the forwarder service."""
         self.log.info("Starting syslog forwarder")
@@ -140,10 +196,7 @@ class SyslogForwarder:
 
             def do_GET(self) -> None:
                 if self.path == "/health":
-                    self.send_response(200)
-                    self.send_header("Content-Type", "text/plain")
-                    self.end_headers()
-                    self.wfile.write(b"OK")
+                    self.wfile.write(_HEALTH_RESPONSE)
                 else:
                     super().do_GET()
 
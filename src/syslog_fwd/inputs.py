@@ -3,12 +3,18 @@
 import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Coroutine
-from typing import Any
+from typing import Any, ClassVar, cast
 
 import structlog
+from prometheus_client import Counter
 
 from .config import InputConfig, Protocol
-from .metrics import ACTIVE_CONNECTIONS, MESSAGES_PARSE_ERRORS, MESSAGES_RECEIVED
+from .metrics import (
+    ACTIVE_CONNECTIONS,
+    MESSAGES_DROPPED,
+    MESSAGES_PARSE_ERRORS,
+    MESSAGES_RECEIVED,
+)
 from .parser import SyslogMessage, SyslogParser
 
 logger = structlog.get_logger()
@@ -31,6 +37,25 @@ class BaseInput(ABC):
         self.handler = handler
         self.log = logger.bind(input=config.name, protocol=config.protocol.value)
 
+        # Metric children bound once; received counters per PRI on first use, so
+        # only priorities actually seen are exported
+        protocol = config.protocol.value
+        self._received: list[Counter | None] = [None] * 192
+        self._parse_errors = MESSAGES_PARSE_ERRORS.labels(protocol=protocol)
+        self._active_connections = ACTIVE_CONNECTIONS.labels(input=config.name)
+
+    def _count_received(self, message: SyslogMessage) -> None:
+        """Increment the received counter for the message's facility and severity."""
+        priority = message.priority
+        counter = self._received[priority]
+        if counter is None:
+            counter = self._received[priority] = MESSAGES_RECEIVED.labels(
+                protocol=self.config.protocol.value,
+                facility=message.facility_name,
+                severity=message.severity_name,
+            )
+        counter.inc()
+
     @abstractmethod
     async def start(self) -> None:
         """Start the input listener."""
@@ -41,53 +66,99 @@ class BaseInput(ABC):
 
 
 class UDPInput(BaseInput):
-    """UDP syslog input listener."""
+    """UDP syslog input listener.
+
+    Datagrams are queued raw by the protocol and parsed and handled by a fixed
+    pool of worker tasks, so bursts are bounded by the queue instead of spawning
+    a task per datagram. With several sockets, each is bound with SO_REUSEPORT
+    and the kernel spreads datagrams across their receive buffers; they are all
+    served by one event loop. reuse_port lets several processes share the port.
+    """
 
     def __init__(self, config: InputConfig, handler: MessageHandler) -> None:
         super().__init__(config, handler)
-        self._transport: asyncio.DatagramTransport | None = None
-        self._protocol: "UDPProtocol | None" = None
+        self._transports: list[asyncio.DatagramTransport] = []
+        self._queue: asyncio.Queue[tuple[bytes, tuple[str, int]]] | None = None
+        self._workers: list[asyncio.Task[None]] = []
 
     async def start(self) -> None:
         """Start UDP listener."""
         loop = asyncio.get_running_loop()
-        self._transport, self._protocol = await loop.create_datagram_endpoint(
-            lambda: UDPProtocol(self.config.name, self.handler),
-            local_addr=(self.config.host, self.config.port),
+        queue: asyncio.Queue[tuple[bytes, tuple[str, int]]] = asyncio.Queue(
+            maxsize=self.config.queue_size
+        )
+        self._queue = queue
+        self._workers = [
+            asyncio.create_task(self._worker(queue)) for _ in range(self.config.workers)
+        ]
+        # reuse_port is only requested when needed, so one socket works everywhere.
+        # All sockets share this event loop; more cores take more processes, each
+        # binding the port with reuse_port
+        reuse_port = self.config.reuse_port or self.config.sockets > 1 or None
+        for _ in range(self.config.sockets):
+            transport, _protocol = await loop.create_datagram_endpoint(
+                lambda: UDPProtocol(self.config.name, queue),
+                local_addr=(self.config.host, self.config.port),
+                reuse_port=reuse_port,
+            )
+            self._transports.append(transport)
+        self.log.info(
+            "UDP listener started", address=self.config.address, sockets=self.config.sockets
         )
-        self.log.info("UDP listener started", address=self.config.address)
 
     async def stop(self) -> None:
         """Stop UDP listener."""
-        if self._transport:
-            self._transport.close()
-            self._transport = None
-            self._protocol = None
+        for transport in self._transports:
+            transport.close()
+        self._transports = []
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
         self.log.info("UDP listener stopped")
 
+    async def _worker(self, queue: "asyncio.Queue[tuple[bytes, tuple[str, int]]]") -> None:
+        """Parse and handle queued datagrams until cancelled."""
+        handler = self.handler
+        parse = SyslogParser.parse
+        count_received = self._count_received
+        parse_errors = self._parse_errors
+
+        while True:
+            data, addr = await queue.get()
+            try:
+                message = parse(data)
+            except ValueError as e:
+                parse_errors.inc()
+                self.log.warning("Failed to parse message", error=str(e), addr=addr)
+                continue
+
+            count_received(message)
+            try:
+                await handler(message)
+            except Exception as e:
+                self.log.error("Error handling message", error=str(e), addr=addr)
+
 
 class UDPProtocol(asyncio.DatagramProtocol):
     """asyncio protocol for UDP syslog."""
 
-    def __init__(self, input_name: str, handler: MessageHandler) -> None:
+    def __init__(
+        self, input_name: str, queue: "asyncio.Queue[tuple[bytes, tuple[str, int]]]"
+    ) -> None:
         self.input_name = input_name
-        self.handler = handler
+        self.queue = queue
         self.log = logger.bind(input=input_name)
+        self._queue_full = MESSAGES_DROPPED.labels(reason="queue_full")
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
-        """Handle received UDP datagram."""
+        """Queue a received UDP datagram for the workers."""
         try:
-            message = SyslogParser.parse(data)
-            MESSAGES_RECEIVED.labels(
-                protocol="udp",
-                facility=message.facility_name,
-                severity=message.severity_name,
-            ).inc()
-            # Schedule the async handler
-            asyncio.create_task(self.handler(message))
-        except ValueError as e:
-            MESSAGES_PARSE_ERRORS.labels(protocol="udp").inc()
-            self.log.warning("Failed to parse message", error=str(e), addr=addr)
+            self.queue.put_nowait((data, addr))
+        except asyncio.QueueFull:
+            # Never block the event loop callback; shed load instead
+            self._queue_full.inc()
 
     def error_received(self, exc: Exception) -> None:
         """Handle UDP error."""
@@ -95,16 +166,23 @@ class UDPProtocol(asyncio.DatagramProtocol):
 
 
 class TCPInput(BaseInput):
-    """TCP syslog input listener."""
+    """TCP syslog input listener.
+
+    Each connection is served by a TCPProtocol that receives straight into its
+    framing buffer, without an intermediate StreamReader copy.
+    """
 
     def __init__(self, config: InputConfig, handler: MessageHandler) -> None:
         super().__init__(config, handler)
         self._server: asyncio.Server | None = None
+        self._clients: set["TCPProtocol"] = set()
+        self._frame_too_large = MESSAGES_DROPPED.labels(reason="frame_too_large")
 
     async def start(self) -> None:
         """Start TCP listener."""
-        self._server = await asyncio.start_server(
-            self._handle_client,
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: TCPProtocol(self),
             self.config.host,
             self.config.port,
         )
@@ -114,96 +192,229 @@ class TCPInput(BaseInput):
         """Stop TCP listener."""
         if self._server:
             self._server.close()
+            # Close open connections and let their queued messages be handled
+            clients = list(self._clients)
+            for client in clients:
+                client.close()
+            await asyncio.gather(*(client.wait_closed() for client in clients))
             await self._server.wait_closed()
             self._server = None
         self.log.info("TCP listener stopped")
 
-    async def _handle_client(
-        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
-    ) -> None:
-        """Handle a TCP client connection."""
-        addr = writer.get_extra_info("peername")
-        self.log.debug("Client connected", addr=addr)
-        ACTIVE_CONNECTIONS.labels(input=self.config.name).inc()
+
+class TCPProtocol(asyncio.BufferedProtocol):
+    """asyncio buffered protocol for one TCP syslog connection.
+
+    Complete messages are framed and parsed in the read callback and handed to
+    a per-connection task that awaits the handler in arrival order. Reading is
+    paused while too many parsed messages are waiting for the handler.
+    Octet-counted frames longer than MAX_FRAME_SIZE are discarded unbuffered.
+    """
+
+    READ_SIZE: ClassVar[int] = 8192
+    MAX_PENDING: ClassVar[int] = 1000
+    MAX_FRAME_SIZE: ClassVar[int] = 65536  # Largest octet-counted frame accepted
+
+    def __init__(self, tcp_input: TCPInput) -> None:
+        self._input = tcp_input
+        self.log = tcp_input.log
+        self._transport: asyncio.Transport | None = None
+        self._addr: Any = None
+        self._task: asyncio.Task[None] | None = None
+
+        # Received bytes live in _buffer[_start:_end]; the rest is free space
+        self._buffer = bytearray(self.READ_SIZE)
+        self._start = 0
+        self._end = 0
+        self._extract: Callable[[bytearray, int, int], tuple[bytes | None, int]] | None = None
+        self._skip = 0  # Bytes of a discarded oversized frame not received yet
+
+        # Parsed messages waiting for the handler; None marks the end of the stream
+        self._messages: asyncio.Queue[SyslogMessage | None] = asyncio.Queue()
+        self._paused = False
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Start handling a new client connection."""
+        self._transport = cast(asyncio.Transport, transport)
+        self._addr = transport.get_extra_info("peername")
+        self.log.debug("Client connected", addr=self._addr)
+        self._input._active_connections.inc()
+        self._input._clients.add(self)
+        self._task = asyncio.get_running_loop().create_task(self._process())
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Return the free tail of the framing buffer for the transport to fill."""
+        buffer = self._buffer
+        if self._start:
+            # Move the incomplete tail to the front once per read; the buffer is
+            # not resized here because the transport may still hold an earlier view
+            remaining = self._end - self._start
+            buffer[:remaining] = buffer[self._start : self._end]
+            self._start = 0
+            self._end = remaining
+        free = len(buffer) - self._end
+        if free < self.READ_SIZE:
+            buffer += bytes(self.READ_SIZE - free)
+        return memoryview(buffer)[self._end :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Frame, parse and queue the complete messages received so far."""
+        buffer = self._buffer
+        offset = self._start
+        end = self._end = self._end + nbytes
+
+        if self._skip:
+            # Rest of an oversized frame
+            skipped = min(self._skip, end - offset)
+            self._skip -= skipped
+            offset += skipped
+
+        # RFC 6587 framing is fixed per connection: a leading digit means
+        # octet-counting, anything else newline framing
+        extract = self._extract
+        if extract is None:
+            if 0x30 <= buffer[offset] <= 0x39:
+                extract = self._extract = self._extract_octet_counted
+            else:
+                extract = self._extract = self._extract_newline
+
+        tcp_input = self._input
+        messages = self._messages
+        while offset < end:
+            message_data, next_offset = extract(buffer, offset, end)
+            if message_data is None:
+                if next_offset == offset:
+                    break  # Incomplete message
+                # Oversized frame: drop it, including the part not received yet
+                tcp_input._frame_too_large.inc()
+                self.log.warning(
+                    "Dropped oversized frame", size=next_offset - offset, addr=self._addr
+                )
+                self._skip = max(next_offset - end, 0)
+                offset = min(next_offset, end)
+                continue
+            offset = next_offset
+
+            try:
+                message = SyslogParser.parse(message_data)
+            except ValueError as e:
+                tcp_input._parse_errors.inc()
+                self.log.warning("Failed to parse message", error=str(e), addr=self._addr)
+                continue
+
+            tcp_input._count_received(message)
+            messages.put_nowait(message)
+
+        if offset == end:
+            # Everything consumed; reuse the buffer from the start without copying
+            self._start = self._end = 0
+        else:
+            self._start = offset
+
+        if not self._paused and messages.qsize() >= self.MAX_PENDING and self._transport:
+            self._transport.pause_reading()
+            self._paused = True
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Finish handling queued messages after the client disconnects."""
+        if exc is not None:
+            self.log.error("Error handling client", error=str(exc), addr=self._addr)
+        self._messages.put_nowait(None)
+
+    def close(self) -> None:
+        """Close the client connection."""
+        if self._transport is not None:
+            self._transport.close()
+
+    async def wait_closed(self) -> None:
+        """Wait until queued messages are handled after the connection closed."""
+        if self._task is not None:
+            await self._task
+
+    async def _process(self) -> None:
+        """Await the handler for each queued message, in order."""
+        tcp_input = self._input
+        handler = tcp_input.handler
+        messages = self._messages
+        resume_at = self.MAX_PENDING // 2
 
         try:
-            buffer = b""
             while True:
-                # Read data from client
-                data = await reader.read(8192)
-                if not data:
+                message = await messages.get()
+                if message is None:
                     break
 
-                buffer += data
-
-                # Process complete messages (newline-delimited or octet-counting)
-                while buffer:
-                    # Try octet-counting first (RFC 6587)
-                    message_data, buffer = self._extract_message(buffer)
-                    if message_data is None:
-                        break
-
-                    try:
-                        message = SyslogParser.parse(message_data)
-                        MESSAGES_RECEIVED.labels(
-                            protocol="tcp",
-                            facility=message.facility_name,
-                            severity=message.severity_name,
-                        ).inc()
-                        await self.handler(message)
-                    except ValueError as e:
-                        MESSAGES_PARSE_ERRORS.labels(protocol="tcp").inc()
-                        self.log.warning("Failed to parse message", error=str(e), addr=addr)
-
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            self.log.error("Error handling client", error=str(e), addr=addr)
-        finally:
-            ACTIVE_CONNECTIONS.labels(input=self.config.name).dec()
-            writer.close()
-            await writer.wait_closed()
-            self.log.debug("Client disconnected", addr=addr)
+                try:
+                    await handler(message)
+                except Exception as e:
+                    self.log.error("Error handling message", error=str(e), addr=self._addr)
 
-    def _extract_message(self, buffer: bytes) -> tuple[bytes | None, bytes]:
-        """Extract a complete message from the buffer.
+                if self._paused and messages.qsize() <= resume_at and self._transport:
+                    self._transport.resume_reading()
+                    self._paused = False
+        finally:
+            tcp_input._active_connections.dec()
+            tcp_input._clients.discard(self)
+            self.log.debug("Client disconnected", addr=self._addr)
+
+    @staticmethod
+    def _extract_octet_counted(
+        buffer: bytearray, offset: int, end: int
+    ) -> tuple[bytes | None, int]:
+        """Extract an octet-counted message ("LEN SP MSG") from buffer[offset:end].
+
+        An incomplete frame waits for more data, even if it contains a newline.
+        Data that does not start with a valid length (ASCII digits, not zero)
+        falls back to newline framing, so a misbehaving sender cannot stall the
+        connection or move the offset backwards. A frame longer than
+        MAX_FRAME_SIZE is not buffered; its end offset is returned without data,
+        possibly past ``end``, so the caller can discard it.
 
-        Supports both newline framing and octet-counting (RFC 6587).
+        Returns:
+            Tuple of (message_data, new_offset).
+            message_data is None if no complete message is available, in which
+            case new_offset is unchanged unless the frame is oversized.
+        """
+        # Find the space after the length; at most 9 digits is a reasonable length
+        space_idx = buffer.find(b" ", offset, min(offset + 10, end))
+        if space_idx > offset:
+            # int() alone would also take "-5", "+5" and "1_0"
+            length = buffer[offset:space_idx]
+            msg_len = int(length) if length.isdigit() else 0
+            if msg_len:
+                msg_start = space_idx + 1
+                msg_end = msg_start + msg_len
+                if msg_len > TCPProtocol.MAX_FRAME_SIZE:
+                    return None, msg_end
+                if end >= msg_end:
+                    return bytes(buffer[msg_start:msg_end]), msg_end
+                return None, offset
+        elif space_idx < 0 and end - offset < 10 and buffer[offset:end].isdigit():
+            # Length field not complete yet
+            return None, offset
+
+        return TCPProtocol._extract_newline(buffer, offset, end)
+
+    @staticmethod
+    def _extract_newline(buffer: bytearray, offset: int, end: int) -> tuple[bytes | None, int]:
+        """Extract a newline-framed message from buffer[offset:end].
+
+        One scan covers LF and CR+LF terminators. Only the message itself is
+        copied out; the buffer is left untouched.
 
         Returns:
-            Tuple of (message_data, remaining_buffer).
+            Tuple of (message_data, new_offset).
             message_data is None if no complete message is available.
         """
-        if not buffer:
-            return None, buffer
-
-        # Check for octet-counting: "LEN SP MSG"
-        # e.g., "123 <...message...>"
-        if buffer[0:1].isdigit():
-            # Find the space after the length
-            space_idx = buffer.find(b" ")
-            if space_idx > 0 and space_idx < 10:  # Reasonable length field
-                try:
-                    msg_len = int(buffer[:space_idx])
-                    msg_start = space_idx + 1
-                    msg_end = msg_start + msg_len
-                    if len(buffer) >= msg_end:
-                        return buffer[msg_start:msg_end], buffer[msg_end:]
-                except ValueError:
-                    pass
-
-        # Fall back to newline framing
-        newline_idx = buffer.find(b"\n")
-        if newline_idx >= 0:
-            return buffer[:newline_idx], buffer[newline_idx + 1 :]
-
-        # Check for CR+LF
-        crlf_idx = buffer.find(b"\r\n")
-        if crlf_idx >= 0:
-            return buffer[:crlf_idx], buffer[crlf_idx + 2 :]
-
-        # No complete message yet
-        return None, buffer
+        newline_idx = buffer.find(b"\n", offset, end)
+        if newline_idx < 0:
+            # No complete message yet
+            return None, offset
+
+        msg_end = newline_idx
+        if msg_end > offset and buffer[msg_end - 1] == 0x0D:  # CR before LF
+            msg_end -= 1
+        return bytes(buffer[offset:msg_end]), newline_idx + 1
 
 
 def create_input(config: InputConfig, handler: MessageHandler) -> BaseInput:
@@ -1,7 +1,6 @@
 """Syslog output forwarders (UDP and TCP)."""
 
 import asyncio
-import socket
 from abc import ABC, abstractmethod
 
 import structlog
@@ -59,16 +58,21 @@ class BaseOutput(ABC):
         Returns:
             Formatted message bytes.
         """
-        if self.config.format == SyslogFormat.RFC5424:
-            return message.to_rfc5424()
-        elif self.config.format == SyslogFormat.RFC3164:
-            return message.to_rfc3164()
-        else:
+        fmt = self.config.format
+        if fmt == SyslogFormat.AUTO:
             # AUTO - use original format
-            if message.format == "rfc5424":
-                return message.to_rfc5424()
-            else:
-                return message.to_rfc3164()
+            fmt = SyslogFormat.RFC5424 if message.format == "rfc5424" else SyslogFormat.RFC3164
+
+        # Reuse the encoding if another destination already produced it
+        if fmt == SyslogFormat.RFC5424:
+            data = message._rfc5424_bytes
+            if data is None:
+                data = message._rfc5424_bytes = message.to_rfc5424()
+        else:
+            data = message._rfc3164_bytes
+            if data is None:
+                data = message._rfc3164_bytes = message.to_rfc3164()
+        return data
 
     async def send_with_retry(self, message: SyslogMessage) -> bool:
         """Send a message with retry logic.
@@ -107,18 +111,59 @@ class BaseOutput(ABC):
         return False
 
 
+class _UDPOutputProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol for an output endpoint; reports send errors and flow control."""
+
+    def __init__(self, log: structlog.stdlib.BoundLogger) -> None:
+        self.log = log
+        # Set while the transport buffer is above its high-water mark
+        self.resumed: asyncio.Future[None] | None = None
+
+    def pause_writing(self) -> None:
+        """Make senders wait until the transport buffer drains."""
+        if self.resumed is None:
+            self.resumed = asyncio.get_running_loop().create_future()
+
+    def resume_writing(self) -> None:
+        """Release senders waiting for the transport buffer to drain."""
+        self._release()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Release waiting senders when the endpoint closes."""
+        self._release()
+
+    def error_received(self, exc: Exception) -> None:
+        """Log asynchronous send errors (e.g. ICMP port unreachable)."""
+        self.log.debug("UDP send error", error=str(exc))
+
+    def _release(self) -> None:
+        resumed, self.resumed = self.resumed, None
+        if resumed is not None and not resumed.done():
+            resumed.set_result(None)
+
+
 class UDPOutput(BaseOutput):
-    """UDP syslog output forwarder."""
+    """UDP syslog output forwarder.
+
+    Datagrams are handed to a connected datagram transport. While its buffer is
+    above the high-water mark, senders wait for it to drain, as TCP senders wait
+    in drain(), so overload backs up into the input queues instead of growing
+    the buffer without bound.
+    """
 
     def __init__(self, config: DestinationConfig) -> None:
         super().__init__(config)
-        self._socket: socket.socket | None = None
+        self._transport: asyncio.DatagramTransport | None = None
+        self._protocol: _UDPOutputProtocol | None = None
 
     async def connect(self) -> None:
-        """Create UDP socket."""
+        """Open a datagram endpoint bound to the destination address."""
         try:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._socket.setblocking(False)
+            loop = asyncio.get_running_loop()
+            self._transport, self._protocol = await loop.create_datagram_endpoint(
+                lambda: _UDPOutputProtocol(self.log),
+                remote_addr=(self.config.host, self.config.port),
+            )
             self._connected = True
             DESTINATION_UP.labels(destination=self.config.name).set(1)
             self.log.info("UDP forwarder ready", address=self.config.address)
@@ -128,24 +173,28 @@ class UDPOutput(BaseOutput):
             raise ConnectionError(f"Failed to create UDP socket: {e}") from e
 
     async def disconnect(self) -> None:
-        """Close UDP socket."""
-        if self._socket:
-            self._socket.close()
-            self._socket = None
+        """Close UDP endpoint."""
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+            self._protocol = None
         self._connected = False
         DESTINATION_UP.labels(destination=self.config.name).set(0)
         self.log.info("UDP forwarder disconnected")
 
     async def send(self, message: SyslogMessage) -> bool:
-        """Send message via UDP."""
-        if not self._socket:
+        """Send message via UDP, waiting while the transport buffer drains."""
+        protocol = self._protocol
+        if protocol is not None and protocol.resumed is not None:
+            # Shielded so one cancelled sender does not fail the others
+            await asyncio.shield(protocol.resumed)
+        transport = self._transport
+        if not transport or transport.is_closing():
             return False
 
-        data = self._format_message(message)
-        loop = asyncio.get_running_loop()
-
         try:
-            await loop.sock_sendto(self._socket, data, (self.config.host, self.config.port))
+            # Written immediately when the socket is writable, buffered otherwise
+            transport.sendto(self._format_message(message))
             return True
         except Exception as e:
             self.log.error("UDP send failed", error=str(e))
@@ -153,13 +202,25 @@ class UDPOutput(BaseOutput):
 
 
 class TCPOutput(BaseOutput):
-    """TCP syslog output forwarder."""
+    """TCP syslog output forwarder.
+
+    Only one write is in flight at a time, without a lock: an uncontended send
+    writes its message directly. Messages sent while a write is draining are
+    coalesced and written together by a flush task with a single write and
+    drain, and every sender in the batch gets the batch outcome.
+    """
 
     def __init__(self, config: DestinationConfig) -> None:
         super().__init__(config)
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
-        self._lock = asyncio.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Set while a write is in flight; later senders queue behind it
+        self._flushing = False
+        self._flush_task: asyncio.Task[None] | None = None
+        # Framed messages waiting for the next flush, and that flush's outcome
+        self._pending: list[bytes] = []
+        self._pending_done: asyncio.Future[bool] | None = None
 
     async def connect(self) -> None:
         """Establish TCP connection."""
@@ -168,6 +229,8 @@ class TCPOutput(BaseOutput):
                 asyncio.open_connection(self.config.host, self.config.port),
                 timeout=10.0,
             )
+            # Looked up once here rather than on every contended send
+            self._loop = asyncio.get_running_loop()
             self._connected = True
             DESTINATION_UP.labels(destination=self.config.name).set(1)
             self.log.info("TCP forwarder connected", address=self.config.address)
@@ -196,26 +259,72 @@ class TCPOutput(BaseOutput):
 
     async def send(self, message: SyslogMessage) -> bool:
         """Send message via TCP with newline framing."""
-        if not self._writer:
+        loop = self._loop
+        if not self._writer or loop is None:
             return False
 
-        data = self._format_message(message)
         # Add newline for framing
-        data = data + b"\n"
+        data = self._format_message(message) + b"\n"
+
+        if self._flushing:
+            # Queue behind the write in flight; shielded so a cancelled sender
+            # does not cancel the outcome shared with the rest of its batch
+            self._pending.append(data)
+            batch_done = self._pending_done
+            if batch_done is None:
+                batch_done = self._pending_done = loop.create_future()
+            return await asyncio.shield(batch_done)
+
+        self._flushing = True
+        try:
+            return await self._flush([data])
+        finally:
+            if self._pending:
+                # Hand whatever queued meanwhile to a flush task, so this sender
+                # returns after its own write even under sustained load
+                self._flush_task = loop.create_task(self._flush_pending())
+            else:
+                self._flushing = False
 
-        async with self._lock:
-            try:
-                self._writer.write(data)
-                await asyncio.wait_for(self._writer.drain(), timeout=5.0)
-                return True
-            except asyncio.TimeoutError:
-                self.log.error("TCP send timeout")
-                self._connected = False
-                return False
-            except Exception as e:
-                self.log.error("TCP send failed", error=str(e))
-                self._connected = False
-                return False
+    async def _flush_pending(self) -> None:
+        """Flush queued batches until none are left, then release the writer."""
+        try:
+            while self._pending:
+                batch = self._pending
+                batch_done = self._pending_done
+                self._pending = []
+                self._pending_done = None
+                ok = False  # Stays False if cancelled mid-write
+                try:
+                    ok = await self._flush(batch)
+                finally:
+                    if batch_done is not None:
+                        batch_done.set_result(ok)
+        finally:
+            if self._pending_done is not None:  # Cancelled with batches still queued
+                self._pending_done.set_result(False)
+            self._pending = []
+            self._pending_done = None
+            self._flushing = False
+            self._flush_task = None
+
+    async def _flush(self, batch: list[bytes]) -> bool:
+        """Write a batch of framed messages and drain once."""
+        if not self._writer:
+            return False
+
+        try:
+            self._writer.writelines(batch)
+            await asyncio.wait_for(self._writer.drain(), timeout=5.0)
+            return True
+        except asyncio.TimeoutError:
+            self.log.error("TCP send timeout")
+            self._connected = False
+            return False
+        except Exception as e:
+            self.log.error("TCP send failed", error=str(e))
+            self._connected = False
+            return False
 
 
 def create_output(config: DestinationConfig) -> BaseOutput:
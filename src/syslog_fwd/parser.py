@@ -1,16 +1,73 @@
 """Syslog message parser for RFC 3164 and RFC 5424 formats."""
 
 import re
-from dataclasses import dataclass
+import sys
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import ClassVar
 
-from .config import FACILITY_REVERSE_MAP, SEVERITY_REVERSE_MAP
+from .config import FACILITY_NAMES, SEVERITY_NAMES
 
+# Python 3.11+ fromisoformat() parses the "Z" UTC designator itself
+_ISO_NEEDS_Z_REWRITE = sys.version_info < (3, 11)
 
-@dataclass
+# Local time is re-read at most once per millisecond; messages in between share it
+_NOW_RESOLUTION_NS = 1_000_000
+_now_read_ns = 0
+_now = datetime.now()
+
+
+def _coarse_now() -> datetime:
+    """Return the current local time, cached for up to _NOW_RESOLUTION_NS."""
+    global _now_read_ns, _now
+    now_ns = time.monotonic_ns()
+    if now_ns - _now_read_ns >= _NOW_RESOLUTION_NS:
+        _now = datetime.now()
+        _now_read_ns = now_ns
+    return _now
+
+
+# RFC 3164 month abbreviations, indexed by month number
+_MONTH_ABBRS = (
+    None, "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
+)
+
+
+# (facility, severity) for every canonical PRI spelling; PRI has at most 192 values
+_PRIORITIES = {str(pri).encode("ascii"): (pri >> 3, pri & 0x07) for pri in range(192)}
+
+
+# Decoded header fields by raw value. Hostnames, app names and PIDs repeat from
+# message to message, so most decodes become one dict lookup and the messages
+# share one interned str per value. Values come from the network, so only those
+# up to the RFC 5424 HOSTNAME limit are kept.
+_MAX_SHARED_FIELDS = 4096
+MAX_SHARED_FIELD_LENGTH = 255
+_shared_fields: dict[bytes, str] = {}
+
+
+def _decode_shared(b: bytes) -> str:
+    """Decode a short, frequently repeated header field."""
+    s = _shared_fields.get(b)
+    if s is None:
+        s = b.decode("utf-8", errors="replace")
+        if len(b) <= MAX_SHARED_FIELD_LENGTH and len(_shared_fields) < _MAX_SHARED_FIELDS:
+            s = _shared_fields[b] = sys.intern(s)
+    return s
+
+
+def _decode_field(b: bytes) -> str | None:
+    """Decode an RFC 5424 header field; the NILVALUE "-" is None and never decoded."""
+    return None if b == b"-" else _decode_shared(b)
+
+
+@dataclass(slots=True)
 class SyslogMessage:
-    """Parsed syslog message."""
+    """Parsed syslog message.
+
+    Slotted, since one instance is allocated per received message.
+    """
 
     facility: int
     severity: int
@@ -24,78 +81,120 @@ class SyslogMessage:
     raw: bytes
     format: str  # "rfc3164" or "rfc5424"
 
+    # Wire encodings memoized by outputs, so fan-out to several destinations with
+    # the same format encodes once; not copied by with_changes() or
+    # dataclasses.replace(). The parser seeds the original format's slot with raw
+    # for true pass-through.
+    _rfc3164_bytes: bytes | None = field(default=None, init=False, repr=False, compare=False)
+    _rfc5424_bytes: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def facility_name(self) -> str:
         """Get facility name."""
-        return FACILITY_REVERSE_MAP.get(self.facility, f"unknown({self.facility})")
+        if 0 <= self.facility < len(FACILITY_NAMES):
+            return FACILITY_NAMES[self.facility]
+        return f"unknown({self.facility})"
 
     @property
     def severity_name(self) -> str:
         """Get severity name."""
-        return SEVERITY_REVERSE_MAP.get(self.severity, f"unknown({self.severity})")
+        if 0 <= self.severity < len(SEVERITY_NAMES):
+            return SEVERITY_NAMES[self.severity]
+        return f"unknown({self.severity})"
 
     @property
     def priority(self) -> int:
         """Calculate PRI value."""
         return (self.facility * 8) + self.severity
 
+    def with_changes(self, changes: dict) -> "SyslogMessage":
+        """Return a copy with some fields replaced.
+
+        Equivalent to dataclasses.replace(self, **changes) for the init fields,
+        without its generic field iteration. The memoized encodings are not
+        carried over, since they describe the original message.
+
+        Args:
+            changes: New values keyed by field name.
+
+        Returns:
+            New SyslogMessage.
+        """
+        get = changes.get
+        return SyslogMessage(
+            get("facility", self.facility),
+            get("severity", self.severity),
+            get("timestamp", self.timestamp),
+            get("hostname", self.hostname),
+            get("app_name", self.app_name),
+            get("proc_id", self.proc_id),
+            get("msg_id", self.msg_id),
+            get("structured_data", self.structured_data),
+            get("message", self.message),
+            get("raw", self.raw),
+            get("format", self.format),
+        )
+
     def to_rfc3164(self) -> bytes:
         """Format message as RFC 3164."""
-        # <PRI>TIMESTAMP HOSTNAME TAG: MESSAGE
-        pri = f"<{self.priority}>"
-        ts = self.timestamp.strftime("%b %d %H:%M:%S") if self.timestamp else "-"
-        hostname = self.hostname or "-"
+        # <PRI>TIMESTAMP HOSTNAME TAG: MESSAGE, built as one string and encoded once
+        ts = self.timestamp
+        if ts:
+            # Same as strftime("%b %d %H:%M:%S") in the C locale, without strftime
+            ts_str = (
+                f"{_MONTH_ABBRS[ts.month]} {ts.day:02d} "
+                f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
+            )
+        else:
+            ts_str = "-"
         tag = self.app_name or "-"
         if self.proc_id:
             tag = f"{tag}[{self.proc_id}]"
-        return f"{pri}{ts} {hostname} {tag}: {self.message}".encode("utf-8")
+        return (
+            f"<{self.facility * 8 + self.severity}>{ts_str} {self.hostname or '-'} "
+            f"{tag}: {self.message}"
+        ).encode("utf-8")
 
     def to_rfc5424(self) -> bytes:
         """Format message as RFC 5424."""
-        # <PRI>VERSION TIMESTAMP HOSTNAME APP-NAME PROCID MSGID SD MSG
-        pri = f"<{self.priority}>1"
-        ts = self.timestamp.isoformat() if self.timestamp else "-"
-        hostname = self.hostname or "-"
-        app_name = self.app_name or "-"
-        proc_id = self.proc_id or "-"
-        msg_id = self.msg_id or "-"
-        sd = self.structured_data or "-"
-        return f"{pri} {ts} {hostname} {app_name} {proc_id} {msg_id} {sd} {self.message}".encode(
-            "utf-8"
-        )
+        # <PRI>VERSION TIMESTAMP HOSTNAME APP-NAME PROCID MSGID SD MSG, encoded once
+        ts = self.timestamp
+        return (
+            f"<{self.facility * 8 + self.severity}>1 {ts.isoformat() if ts else '-'} "
+            f"{self.hostname or '-'} {self.app_name or '-'} {self.proc_id or '-'} "
+            f"{self.msg_id or '-'} {self.structured_data or '-'} {self.message}"
+        ).encode("utf-8")
 
 
 class SyslogParser:
     """Parser for syslog messages supporting RFC 3164 and RFC 5424."""
 
-    # RFC 5424: <PRI>VERSION SP TIMESTAMP SP HOSTNAME SP APP-NAME SP PROCID SP MSGID SP SD MSG
-    RFC5424_PATTERN: ClassVar[re.Pattern] = re.compile(
-        rb"<(\d{1,3})>1 "  # PRI and VERSION
-        rb"(\S+) "  # TIMESTAMP
-        rb"(\S+) "  # HOSTNAME
-        rb"(\S+) "  # APP-NAME
-        rb"(\S+) "  # PROCID
-        rb"(\S+) "  # MSGID
-        rb"(\[.*?\]|-) ?"  # STRUCTURED-DATA (simplified)
-        rb"(.*)$",  # MSG
+    # One anchored alternation tried in the order RFC 5424, RFC 3164, simple, so a
+    # single scan both parses and dispatches; the branch is told by which group is set.
+    MESSAGE_PATTERN: ClassVar[re.Pattern] = re.compile(
+        rb"<(?P<pri>\d{1,3})>"  # PRI
+        # RFC 5424: VERSION SP TIMESTAMP SP HOSTNAME SP APP-NAME SP PROCID SP MSGID SP SD MSG
+        rb"(?:1 "
+        rb"(?P<ts5424>\S+) "  # TIMESTAMP
+        rb"(?P<hostname5424>\S+) "  # HOSTNAME
+        rb"(?P<app_name>\S+) "  # APP-NAME
+        rb"(?P<proc_id>\S+) "  # PROCID
+        rb"(?P<msg_id>\S+) "  # MSGID
+        rb"(?P<sd>\[.*?\]|-) ?"  # STRUCTURED-DATA (simplified)
+        rb"(?P<msg5424>.*)"  # MSG
+        # RFC 3164: TIMESTAMP (Mmm dd hh:mm:ss) SP HOSTNAME SP TAG: MSG
+        rb"|(?P<ts3164>[A-Z][a-z]{2} [ \d]\d \d{2}:\d{2}:\d{2}) "  # TIMESTAMP
+        rb"(?P<hostname3164>\S+) "  # HOSTNAME
+        rb"(?P<tag_msg>.*)"  # TAG + MSG
+        # Simple: just PRI
+        rb"|(?P<msg>.*)"
+        rb")$",
         re.DOTALL,
     )
 
-    # RFC 3164: <PRI>TIMESTAMP HOSTNAME TAG: MSG
-    # Timestamp: Mmm dd hh:mm:ss
-    RFC3164_PATTERN: ClassVar[re.Pattern] = re.compile(
-        rb"<(\d{1,3})>"  # PRI
-        rb"([A-Z][a-z]{2} [ \d]\d \d{2}:\d{2}:\d{2}) "  # TIMESTAMP
-        rb"(\S+) "  # HOSTNAME
-        rb"(.*)$",  # TAG + MSG
-        re.DOTALL,
-    )
-
-    # Simple pattern for messages with just PRI
-    SIMPLE_PATTERN: ClassVar[re.Pattern] = re.compile(
-        rb"<(\d{1,3})>(.*)$",
-        re.DOTALL,
-    )
+    # RFC 3164 TAG[PID]: MSG
+    TAG_PATTERN: ClassVar[re.Pattern] = re.compile(rb"(\S+?)(?:\[(\d+)\])?:\s*(.*)$", re.DOTALL)
+    TAG_TEXT_PATTERN: ClassVar[re.Pattern] = re.compile(r"(\S+?)(?:\[(\d+)\])?:\s*(.*)$", re.DOTALL)
 
     # Month name mapping
     MONTHS: ClassVar[dict[str, int]] = {
@@ -131,19 +230,12 @@ class SyslogParser:
         # Remove trailing newlines
         data = data.rstrip(b"\r\n")
 
-        # Try RFC 5424 first
-        match = cls.RFC5424_PATTERN.match(data)
-        if match:
-            return cls._parse_rfc5424(match, data)
-
-        # Try RFC 3164
-        match = cls.RFC3164_PATTERN.match(data)
-        if match:
-            return cls._parse_rfc3164(match, data)
-
-        # Fall back to simple parsing
-        match = cls.SIMPLE_PATTERN.match(data)
+        match = cls.MESSAGE_PATTERN.match(data)
         if match:
+            if match["ts5424"] is not None:
+                return cls._parse_rfc5424(match, data)
+            if match["ts3164"] is not None:
+                return cls._parse_rfc3164(match, data)
             return cls._parse_simple(match, data)
 
         raise ValueError(f"Unable to parse syslog message: {data[:100]!r}")
@@ -151,6 +243,11 @@ class SyslogParser:
     @classmethod
     def _parse_priority(cls, pri_str: bytes) -> tuple[int, int]:
         """Parse PRI value into facility and severity."""
+        # One dict lookup instead of int() for the usual spellings; zero-padded
+        # or out-of-range values take the slow path
+        parsed = _PRIORITIES.get(pri_str)
+        if parsed is not None:
+            return parsed
         pri = int(pri_str)
         if pri < 0 or pri > 191:
             raise ValueError(f"Invalid PRI value: {pri}")
@@ -161,42 +258,43 @@ class SyslogParser:
     @classmethod
     def _parse_rfc5424(cls, match: re.Match, raw: bytes) -> SyslogMessage:
         """Parse RFC 5424 message."""
-        pri, ts, hostname, app_name, proc_id, msg_id, sd, msg = match.groups()
+        pri, ts, hostname, app_name, proc_id, msg_id, sd, msg = match.group(
+            "pri", "ts5424", "hostname5424", "app_name", "proc_id", "msg_id", "sd", "msg5424"
+        )
         facility, severity = cls._parse_priority(pri)
 
-        # Parse timestamp
-        ts_str = ts.decode("utf-8", errors="replace")
+        # Parse timestamp; ISO 8601 is ASCII, so a failed ASCII decode is unparseable too
         timestamp = None
-        if ts_str != "-":
+        if ts != b"-":
             try:
                 # Handle various ISO 8601 formats
-                timestamp = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+                ts_str = ts.decode("ascii")
+                if _ISO_NEEDS_Z_REWRITE:
+                    ts_str = ts_str.replace("Z", "+00:00")
+                timestamp = datetime.fromisoformat(ts_str)
             except ValueError:
                 pass
 
-        # Decode fields
-        def decode_field(b: bytes) -> str | None:
-            s = b.decode("utf-8", errors="replace")
-            return None if s == "-" else s
-
-        return SyslogMessage(
+        parsed = SyslogMessage(
             facility=facility,
             severity=severity,
             timestamp=timestamp,
-            hostname=decode_field(hostname),
-            app_name=decode_field(app_name),
-            proc_id=decode_field(proc_id),
-            msg_id=decode_field(msg_id),
-            structured_data=decode_field(sd),
+            hostname=_decode_field(hostname),
+            app_name=_decode_field(app_name),
+            proc_id=_decode_field(proc_id),
+            msg_id=_decode_field(msg_id),
+            structured_data=None if sd == b"-" else sd.decode("utf-8", errors="replace"),
             message=msg.decode("utf-8", errors="replace"),
             raw=raw,
             format="rfc5424",
         )
+        parsed._rfc5424_bytes = raw  # Pass-through encoding
+        return parsed
 
     @classmethod
     def _parse_rfc3164(cls, match: re.Match, raw: bytes) -> SyslogMessage:
         """Parse RFC 3164 message."""
-        pri, ts, hostname, tag_msg = match.groups()
+        pri, ts, hostname, tag_msg = match.group("pri", "ts3164", "hostname3164", "tag_msg")
         facility, severity = cls._parse_priority(pri)
 
         # Parse timestamp (Mmm dd hh:mm:ss)
@@ -210,29 +308,35 @@ class SyslogParser:
             time_parts = parts[2].split(":")
             hour, minute, second = int(time_parts[0]), int(time_parts[1]), int(time_parts[2])
             # Use current year since RFC 3164 doesn't include year
-            year = datetime.now().year
+            year = _coarse_now().year
             timestamp = datetime(year, month, day, hour, minute, second)
         except (IndexError, ValueError):
             pass
 
-        # Parse TAG and MSG
-        tag_msg_str = tag_msg.decode("utf-8", errors="replace")
+        # Parse TAG and MSG: try to extract TAG[PID]: MSG
         app_name = None
         proc_id = None
-        message = tag_msg_str
-
-        # Try to extract TAG[PID]: MSG
-        tag_match = re.match(r"^(\S+?)(?:\[(\d+)\])?:\s*(.*)$", tag_msg_str, re.DOTALL)
-        if tag_match:
-            app_name = tag_match.group(1)
-            proc_id = tag_match.group(2)
-            message = tag_match.group(3)
-
-        return SyslogMessage(
+        tag_match = cls.TAG_PATTERN.match(tag_msg)
+        if tag_match and tag_msg[: tag_match.start(3)].isascii():
+            # ASCII tag: split on bytes and decode only the pieces. The message is
+            # lstripped so Unicode whitespace after the colon is skipped as before.
+            tag, pid, msg = tag_match.groups()
+            app_name = _decode_shared(tag)
+            proc_id = _decode_shared(pid) if pid is not None else None
+            message = msg.decode("utf-8", errors="replace").lstrip()
+        else:
+            message = tag_msg.decode("utf-8", errors="replace")
+            if tag_match:
+                # Non-ASCII tag: match on text so Unicode whitespace/digits behave as in str
+                text_match = cls.TAG_TEXT_PATTERN.match(message)
+                if text_match:
+                    app_name, proc_id, message = text_match.groups()
+
+        parsed = SyslogMessage(
             facility=facility,
             severity=severity,
             timestamp=timestamp,
-            hostname=hostname.decode("utf-8", errors="replace"),
+            hostname=_decode_shared(hostname),
             app_name=app_name,
             proc_id=proc_id,
             msg_id=None,
@@ -241,17 +345,19 @@ class SyslogParser:
             raw=raw,
             format="rfc3164",
         )
+        parsed._rfc3164_bytes = raw  # Pass-through encoding
+        return parsed
 
     @classmethod
     def _parse_simple(cls, match: re.Match, raw: bytes) -> SyslogMessage:
         """Parse simple message with just PRI."""
-        pri, msg = match.groups()
+        pri, msg = match.group("pri", "msg")
         facility, severity = cls._parse_priority(pri)
 
         return SyslogMessage(
             facility=facility,
             severity=severity,
-            timestamp=datetime.now(),
+            timestamp=_coarse_now(),
             hostname=None,
             app_name=None,
             proc_id=None,
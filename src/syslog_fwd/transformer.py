@@ -1,15 +1,172 @@
 """Message transformation for syslog messages."""
 
+import dataclasses
 import re
-from dataclasses import replace
+from dataclasses import dataclass
+from typing import Any
 
 import structlog
 
-from .config import MaskConfig, TransformConfig
+from .config import MaskConfig, TransformConfig, required_literal
 from .parser import SyslogMessage
 
 logger = structlog.get_logger()
 
+# Group references and conditionals would point at the wrong group once patterns
+# are combined, and a global inline flag such as (?x) would apply to all of them
+_UNCOMBINABLE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+def _any_of(patterns: list[str]) -> re.Pattern | None:
+    """Compile patterns into one alternation that matches wherever any of them does.
+
+    Returns:
+        The combined pattern, or None if the patterns cannot be combined
+        (backreferences, conditional groups, inline global flags or repeated
+        group names).
+    """
+    if any(_UNCOMBINABLE.search(p) for p in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
+    except re.error:
+        return None
+
+
+# Fields a transformation may clear or set to a string, and those set as integers
+_TEXT_FIELDS = frozenset({"hostname", "app_name", "proc_id", "msg_id", "structured_data"})
+_INT_FIELDS = frozenset({"facility", "severity"})
+
+# Distinct transform_names lists whose resolution is cached
+_MAX_RESOLVED = 256
+
+
+def _is_noop(transform: TransformConfig) -> bool:
+    """Whether a transformation has no operations and can never change a message."""
+    return not (
+        transform.remove_fields
+        or transform.set_fields
+        or transform.message_replace
+        or transform.mask_patterns
+        or transform.message_prefix
+        or transform.message_suffix
+    )
+
+
+@dataclass(slots=True)
+class _CompiledTransform:
+    """A transformation with its operations resolved once from the config."""
+
+    config: TransformConfig
+    match: re.Pattern | None  # Applies to every message when None
+    field_changes: dict[str, Any]  # Same for every message: removed and set fields
+    replace: tuple[re.Pattern, str] | None  # message_replace pattern and replacement
+    # mask_patterns, applied in order, with the literal each match contains
+    masks: tuple[tuple[re.Pattern, str, str | None], ...]
+    any_mask: re.Pattern | None  # Matches wherever any mask does
+    mask_literals: tuple[str, ...] | None  # Text any mask matches contains one of these
+    prefix: str
+    suffix: str
+    rewrites_message: bool  # Any operation on the message text
+
+
+def _compile_transform(t: TransformConfig) -> _CompiledTransform:
+    """Resolve a transformation's operations ahead of the per-message path."""
+    field_changes: dict[str, Any] = {}
+    for field in t.remove_fields or ():
+        if field in _TEXT_FIELDS:
+            field_changes[field] = None
+    for field, value in (t.set_fields or {}).items():
+        if field in _TEXT_FIELDS:
+            field_changes[field] = value
+        elif field in _INT_FIELDS:
+            field_changes[field] = int(value)
+
+    replace = None
+    if t.message_replace and t.message_replace.pattern:
+        replace = (t.message_replace.regex, t.message_replace.replacement)
+
+    masks = tuple(
+        (mask.regex, mask.replacement, required_literal(mask.regex))
+        for mask in t.mask_patterns or ()
+    )
+    # One scan tells whether any mask applies, so clean messages skip the
+    # per-mask passes
+    any_mask = None
+    mask_literals = None
+    if len(masks) > 1:
+        any_mask = _any_of([mask.pattern for mask in t.mask_patterns or ()])
+        # Substring checks are cheaper still, when every mask has a literal
+        literals = tuple(literal for _, _, literal in masks)
+        if None not in literals:
+            mask_literals = literals
+
+    prefix = t.message_prefix or ""
+    suffix = t.message_suffix or ""
+    return _CompiledTransform(
+        config=t,
+        match=t.match_regex if t.match_pattern else None,
+        field_changes=field_changes,
+        replace=replace,
+        masks=masks,
+        any_mask=any_mask,
+        mask_literals=mask_literals,
+        prefix=prefix,
+        suffix=suffix,
+        rewrites_message=bool(replace or masks or prefix or suffix),
+    )
+
+
+def _changes_fields(message: SyslogMessage, changes: dict[str, Any]) -> bool:
+    """Whether any of the field changes differs from the message's current value."""
+    for field, value in changes.items():
+        if getattr(message, field) != value:
+            return True
+    return False
+
+
+def _may_mask(compiled: _CompiledTransform, text: str) -> bool:
+    """Whether any of a transformation's masks can match the text."""
+    literals = compiled.mask_literals
+    if literals is not None:
+        for literal in literals:
+            if literal in text:
+                break
+        else:
+            return False  # Every mask match would contain one of them
+    any_mask = compiled.any_mask
+    return any_mask is None or any_mask.search(text) is not None
+
+
+def _fuse(transforms: list[_CompiledTransform]) -> tuple[_CompiledTransform, ...]:
+    """Fold consecutive unconditional transformations so they copy the message once.
+
+    Field changes never touch the message text, and a prefix or suffix only wraps
+    it, so two transformations without a match_pattern combine when the second
+    has no replacement or masks, or the first only changes fields. Both orders of
+    application give the same message.
+    """
+    fused: list[_CompiledTransform] = []
+    for compiled in transforms:
+        prev = fused[-1] if fused else None
+        if prev is None or prev.match is not None or compiled.match is not None:
+            fused.append(compiled)
+        elif not (compiled.replace or compiled.masks):
+            fused[-1] = dataclasses.replace(
+                prev,
+                field_changes={**prev.field_changes, **compiled.field_changes},
+                prefix=compiled.prefix + prev.prefix,
+                suffix=prev.suffix + compiled.suffix,
+                rewrites_message=prev.rewrites_message or compiled.rewrites_message,
+            )
+        elif not prev.rewrites_message:
+            fused[-1] = dataclasses.replace(
+                compiled, field_changes={**prev.field_changes, **compiled.field_changes}
+            )
+        else:
+            fused.append(compiled)
+    return tuple(fused)
+
 
 class MessageTransformer:
     """Transform syslog messages by modifying or removing fields."""
@@ -21,23 +178,22 @@ class MessageTransformer:
             transforms: List of transformation configurations.
         """
         self.transforms = transforms
-        self._transforms_by_name: dict[str, TransformConfig] = {t.name: t for t in transforms}
-        self._compiled_patterns: dict[str, re.Pattern] = {}
+        # Transformations that can change a message; the others are skipped
+        self._active: list[_CompiledTransform] = []
+        self._active_by_name: dict[str, _CompiledTransform] = {}
+        self._pipeline: tuple[_CompiledTransform, ...] = ()  # _active, fused
+        # id(transform_names) -> (transform_names, resolved transforms); callers pass
+        # the same list for every message, e.g. a filter's transforms
+        self._resolved: dict[int, tuple[list[str], tuple[_CompiledTransform, ...]]] = {}
         self._compile_patterns()
         self.log = logger.bind(component="transformer")
 
     def _compile_patterns(self) -> None:
-        """Pre-compile regex patterns for performance."""
-        for t in self.transforms:
-            if t.match_pattern:
-                self._compiled_patterns[t.name] = re.compile(t.match_pattern)
-            if t.message_replace and t.message_replace.pattern:
-                key = f"{t.name}_replace"
-                self._compiled_patterns[key] = re.compile(t.message_replace.pattern)
-            if t.mask_patterns:
-                for i, mask in enumerate(t.mask_patterns):
-                    key = f"{t.name}_mask_{i}"
-                    self._compiled_patterns[key] = re.compile(mask.pattern)
+        """Resolve each transformation's patterns and field changes once."""
+        self._active = [_compile_transform(t) for t in self.transforms if not _is_noop(t)]
+        self._active_by_name = {c.config.name: c for c in self._active}
+        self._pipeline = _fuse(self._active)
+        self._resolved = {}
 
     def transform(self, message: SyslogMessage, transform_names: list[str] | None = None) -> SyslogMessage:
         """Apply transformations to a message.
@@ -49,102 +205,91 @@ class MessageTransformer:
         Returns:
             Transformed message (may be the same object if no transforms applied).
         """
+        if not self._active:
+            return message
+
         result = message
 
         if transform_names:
             # Apply only specified transforms in order
-            for name in transform_names:
-                t = self._transforms_by_name.get(name)
-                if t and self._should_apply(t, result):
-                    result = self._apply_transform(t, result)
+            for compiled in self._resolve(transform_names):
+                if self._should_apply(compiled, result):
+                    result = self._apply_transform(compiled, result)
         else:
             # Apply all transforms
-            for t in self.transforms:
-                if self._should_apply(t, result):
-                    result = self._apply_transform(t, result)
+            for compiled in self._pipeline:
+                if self._should_apply(compiled, result):
+                    result = self._apply_transform(compiled, result)
 
         return result
 
-    def _should_apply(self, transform: TransformConfig, message: SyslogMessage) -> bool:
+    def _resolve(self, transform_names: list[str]) -> tuple[_CompiledTransform, ...]:
+        """Resolve transform names to fused active transforms, cached per names list.
+
+        The cache holds a reference to each list, so its id cannot be reused
+        while cached; the identity check guards against anything else.
+        """
+        cached = self._resolved.get(id(transform_names))
+        if cached is not None and cached[0] is transform_names:
+            return cached[1]
+
+        active_by_name = self._active_by_name
+        resolved = _fuse(
+            [active_by_name[name] for name in transform_names if name in active_by_name]
+        )
+        if len(self._resolved) < _MAX_RESOLVED:
+            self._resolved[id(transform_names)] = (transform_names, resolved)
+        return resolved
+
+    def _should_apply(self, compiled: _CompiledTransform, message: SyslogMessage) -> bool:
         """Check if a transformation should be applied to a message."""
         # If no match_pattern, apply to all messages
-        if not transform.match_pattern:
-            return True
-
-        pattern = self._compiled_patterns.get(transform.name)
-        if pattern:
-            return bool(pattern.search(message.message))
-        return False
+        pattern = compiled.match
+        return pattern is None or pattern.search(message.message) is not None
 
     def _apply_transform(
-        self, transform: TransformConfig, message: SyslogMessage
+        self, compiled: _CompiledTransform, message: SyslogMessage
     ) -> SyslogMessage:
-        """Apply a single transformation to a message."""
-        changes: dict = {}
-
-        # Remove fields
-        if transform.remove_fields:
-            for field in transform.remove_fields:
-                if field == "hostname":
-                    changes["hostname"] = None
-                elif field == "app_name":
-                    changes["app_name"] = None
-                elif field == "proc_id":
-                    changes["proc_id"] = None
-                elif field == "msg_id":
-                    changes["msg_id"] = None
-                elif field == "structured_data":
-                    changes["structured_data"] = None
-
-        # Set fields to specific values
-        if transform.set_fields:
-            for field, value in transform.set_fields.items():
-                if field in ("hostname", "app_name", "proc_id", "msg_id", "structured_data"):
-                    changes[field] = value
-                elif field == "facility":
-                    changes["facility"] = int(value)
-                elif field == "severity":
-                    changes["severity"] = int(value)
+        """Apply a single transformation to a message.
+
+        Returns the message itself when the transformation leaves every field as it
+        was, e.g. when no replacement matched or a removed field was already unset.
+        """
+        field_changes = compiled.field_changes
+        if not compiled.rewrites_message:
+            # Only field changes, which are the same for every message
+            if _changes_fields(message, field_changes):
+                return message.with_changes(field_changes)
+            return message
+
+        text = message.message
 
         # Replace in message content
-        if transform.message_replace:
-            pattern = self._compiled_patterns.get(f"{transform.name}_replace")
-            if pattern:
-                new_message = pattern.sub(
-                    transform.message_replace.replacement,
-                    message.message,
-                )
-                changes["message"] = new_message
+        if compiled.replace:
+            pattern, replacement = compiled.replace
+            text = pattern.sub(replacement, text)
 
         # Mask sensitive data
-        if transform.mask_patterns:
-            new_message = changes.get("message", message.message)
-            for i, mask in enumerate(transform.mask_patterns):
-                pattern = self._compiled_patterns.get(f"{transform.name}_mask_{i}")
-                if pattern:
-                    new_message = pattern.sub(mask.replacement, new_message)
-            changes["message"] = new_message
+        if compiled.masks and _may_mask(compiled, text):
+            for pattern, replacement, literal in compiled.masks:
+                # A substring check is far cheaper than a scan that cannot match
+                if literal is None or literal in text:
+                    text = pattern.sub(replacement, text)
 
         # Prepend/append to message
-        if transform.message_prefix:
-            msg = changes.get("message", message.message)
-            changes["message"] = transform.message_prefix + msg
-
-        if transform.message_suffix:
-            msg = changes.get("message", message.message)
-            changes["message"] = msg + transform.message_suffix
-
-        # Apply changes using dataclass replace
-        if changes:
-            return replace(message, **changes)
+        if compiled.prefix or compiled.suffix:
+            text = f"{compiled.prefix}{text}{compiled.suffix}"
 
+        # Apply changes on a copy; sub() returns its input when nothing matched
+        if text != message.message:
+            return message.with_changes({**field_changes, "message": text})
+        if _changes_fields(message, field_changes):
+            return message.with_changes(field_changes)
         return message
 
     def reload(self, transforms: list[TransformConfig]) -> None:
         """Reload transformer with new configurations."""
         self.transforms = transforms
-        self._transforms_by_name = {t.name: t for t in transforms}
-        self._compiled_patterns.clear()
         self._compile_patterns()
         self.log.info("Transforms reloaded", count=len(transforms))
 
@@ -5,16 +5,31 @@ Sends 10,000 messages and measures throughput and latency.
 """
 
 import asyncio
+import ctypes
+import ctypes.util
+import errno
+import multiprocessing
+import os
+import re
 import socket
 import statistics
 import time
+from array import array
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from itertools import accumulate, chain
+from typing import Any, TypeVar
 
 import click
 import httpx
 
+try:
+    import uvloop
+except ImportError:  # Optional, Linux/macOS only
+    uvloop = None
+
 
 @dataclass
 class PerfResults:
@@ -24,9 +39,7 @@ class PerfResults:
     duration_seconds: float
     messages_per_second: float
     avg_latency_ms: float
-    p50_latency_ms: float
-    p95_latency_ms: float
-    p99_latency_ms: float
+    latency_percentiles_ms: dict[float, float]  # Percentile -> latency
     messages_received: int
     messages_forwarded: int
     messages_dropped: int
@@ -47,8 +60,8 @@ class IntervalStats:
     success_rate: float
 
 
-def generate_rfc5424_message(seq: int, proc_id: str = "1234", msg_id: str = "ID47") -> bytes:
-    """Generate an RFC 5424 syslog message with proc_id and msg_id fields."""
+def _rfc5424_template(proc_id: str = "1234", msg_id: str = "ID47") -> bytes:
+    """Encode an RFC 5424 test message once, with %d in place of the sequence number."""
     # Priority: facility=local0 (16), severity=info (6) => 16*8+6 = 134
     pri = 134
     version = 1
@@ -56,54 +69,234 @@ def generate_rfc5424_message(seq: int, proc_id: str = "1234", msg_id: str = "ID4
     hostname = "perftest"
     app_name = "benchmark"
     structured_data = "-"
-    msg = f"Performance test message {seq}/10000 - testing field removal transform"
+    msg = "Performance test message %d/10000 - testing field removal transform"
 
     # RFC 5424: <PRI>VERSION TIMESTAMP HOSTNAME APP-NAME PROCID MSGID STRUCTURED-DATA MSG
     syslog_msg = f"<{pri}>{version} {timestamp} {hostname} {app_name} {proc_id} {msg_id} {structured_data} {msg}"
     return syslog_msg.encode("utf-8")
 
 
-async def send_messages_udp(
-    host: str, port: int, count: int, batch_size: int = 100
-) -> tuple[float, list[float]]:
-    """Send messages via UDP and return duration and per-batch latencies."""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.setblocking(False)
+def generate_rfc5424_message(seq: int, proc_id: str = "1234", msg_id: str = "ID47") -> bytes:
+    """Generate an RFC 5424 syslog message with proc_id and msg_id fields."""
+    return _rfc5424_template(proc_id, msg_id) % seq
 
-    latencies: list[float] = []
-    start_time = time.perf_counter()
 
-    for batch_start in range(0, count, batch_size):
-        batch_end = min(batch_start + batch_size, count)
-        batch_start_time = time.perf_counter()
+def generate_rfc5424_batch(first_seq: int, count: int) -> list[bytes]:
+    """Generate consecutive RFC 5424 messages sharing one encoded template.
+
+    The timestamp is taken once per batch; only the sequence number is
+    formatted per message.
+    """
+    template = _rfc5424_template()
+    return [template % seq for seq in range(first_seq, first_seq + count)]
+
+
+T = TypeVar("T")
+
+
+def run_async(coro: Coroutine[Any, Any, T], loop: str = "uvloop") -> T:
+    """Run a test coroutine on uvloop, or on the default asyncio loop.
+
+    The sender's event loop should not be what limits the measured throughput,
+    so uvloop is used unless the asyncio loop is asked for or uvloop is missing.
+    """
+    if loop == "uvloop" and uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def generate_batches(count: int, batch_size: int, first_seq: int = 1) -> list[list[bytes]]:
+    """Generate every batch of a burst up front, so the timed loop only sends."""
+    return [
+        generate_rfc5424_batch(first_seq + batch_start, min(batch_size, count - batch_start))
+        for batch_start in range(0, count, batch_size)
+    ]
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_sendmmsg() -> Callable[..., int] | None:
+    """Return libc's sendmmsg(2), or None where it is unavailable (non-Linux)."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        sendmmsg = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    sendmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int]
+    sendmmsg.restype = ctypes.c_int
+    return sendmmsg
+
+
+_sendmmsg = _load_sendmmsg()
+
+# Most datagrams handed to one sendmmsg(2) call
+_MMSG_CAPACITY = 1024
+
+
+def _alloc_mmsg_buffers() -> tuple[ctypes.Array, ctypes.Array]:
+    """Allocate the iovec and mmsghdr arrays reused across sendmmsg(2) calls.
+
+    Each header points at its own iovec for good, so a batch only rewrites
+    the iovecs.
+    """
+    iovecs = (_IOVec * _MMSG_CAPACITY)()
+    headers = (_MMsgHdr * _MMSG_CAPACITY)()
+    for i in range(_MMSG_CAPACITY):
+        headers[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+        headers[i].msg_hdr.msg_iovlen = 1
+    return iovecs, headers
+
 
-        for i in range(batch_start, batch_end):
-            msg = generate_rfc5424_message(i + 1)
+_iovecs, _headers = _alloc_mmsg_buffers()
+
+
+def send_datagrams(sock: socket.socket, msgs: list[bytes]) -> int:
+    """Send datagrams on a connected socket, batched into one syscall where possible.
+
+    Returns:
+        Number of datagrams sent; fewer than len(msgs) if the socket buffer filled.
+
+    Raises:
+        BlockingIOError: If not even the first datagram could be sent.
+    """
+    if _sendmmsg is None:
+        for sent, msg in enumerate(msgs):
             try:
-                sock.sendto(msg, (host, port))
+                sock.send(msg)
             except BlockingIOError:
-                await asyncio.sleep(0.001)
-                sock.sendto(msg, (host, port))
+                if sent:
+                    return sent
+                raise
+        return len(msgs)
+
+    msgs = msgs[:_MMSG_CAPACITY]
+    count = len(msgs)
+    # Point the iovecs at consecutive slices of one joined buffer, written as a
+    # flat (base, len) array in a single copy instead of per-field ctypes stores.
+    # unsigned long matches both void* and size_t on Linux.
+    blob = b"".join(msgs)
+    lengths = [len(msg) for msg in msgs]
+    base = ctypes.cast(ctypes.c_char_p(blob), ctypes.c_void_p).value
+    fields = array("L", chain.from_iterable(zip(accumulate(lengths[:-1], initial=base), lengths)))
+    ctypes.memmove(_iovecs, fields.buffer_info()[0], len(fields) * fields.itemsize)
+
+    sent = _sendmmsg(sock.fileno(), _headers, count, 0)
+    if sent < 0:
+        err = ctypes.get_errno()
+        if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+            raise BlockingIOError(err, "sendmmsg would block")
+        raise OSError(err, f"sendmmsg failed: {errno.errorcode.get(err, err)}")
+    return sent
+
+
+async def send_udp_batch(sock: socket.socket, msgs: list[bytes]) -> None:
+    """Send all datagrams of a batch, waiting briefly whenever the socket buffer is full."""
+    while msgs:
+        try:
+            msgs = msgs[send_datagrams(sock, msgs) :]
+        except BlockingIOError:
+            await asyncio.sleep(0.001)
 
-        batch_latency = (time.perf_counter() - batch_start_time) * 1000
-        latencies.append(batch_latency)
 
-        # Small yield to allow event loop processing
-        if batch_start % 1000 == 0:
-            await asyncio.sleep(0.001)
+async def send_paced(
+    send_batch: Callable[[list[bytes]], Awaitable[None]],
+    count: int,
+    rate: float,
+    first_seq: int = 1,
+) -> float:
+    """Send count messages at a steady rate and return the elapsed time.
+
+    Batches of about 10ms worth of messages are sent against a monotonic
+    deadline (start + sent / rate), sleeping only when ahead of it, so the
+    rate holds across the interval instead of bursting and then idling.
+    """
+    batch_size = max(1, min(100, int(rate / 100)))
+    start = time.perf_counter()
+    for batch_start in range(0, count, batch_size):
+        delay = start + batch_start / rate - time.perf_counter()
+        if delay > 1e-4:
+            await asyncio.sleep(delay)
+        batch_count = min(batch_size, count - batch_start)
+        await send_batch(generate_rfc5424_batch(first_seq + batch_start, batch_count))
+    return time.perf_counter() - start
+
+
+# Socket send buffer requested for test traffic (the kernel caps it at wmem_max),
+# so the default buffer does not limit bandwidth on loopback
+SEND_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def open_udp_socket(host: str, port: int) -> socket.socket:
+    """Open a non-blocking UDP socket connected to the forwarder."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+    sock.setblocking(False)
+    sock.connect((host, port))
+    return sock
+
+
+async def send_messages_udp(
+    host: str,
+    port: int,
+    count: int,
+    batch_size: int = 100,
+    first_seq: int = 1,
+    sock: socket.socket | None = None,
+) -> tuple[float, list[int]]:
+    """Send messages via UDP and return duration and per-batch latencies in ns.
+
+    Sends on sock and leaves it open when given, else on a socket of its own.
+    """
+    own_sock = sock is None
+    if sock is None:
+        sock = open_udp_socket(host, port)
+    batches = generate_batches(count, batch_size, first_seq)
+
+    latencies: list[int] = []
+    start_time = time.perf_counter()
+
+    for batch in batches:
+        batch_start_ns = time.perf_counter_ns()
+
+        # One sendmmsg(2) per batch instead of one sendto(2) per message
+        await send_udp_batch(sock, batch)
+
+        latencies.append(time.perf_counter_ns() - batch_start_ns)
 
     duration = time.perf_counter() - start_time
-    sock.close()
+    if own_sock:
+        sock.close()
 
     return duration, latencies
 
 
-async def send_messages_tcp(
-    host: str, port: int, count: int, batch_size: int = 100, timeout: float = 30.0
-) -> tuple[float, list[float]]:
-    """Send messages via TCP and return duration and per-batch latencies."""
-    latencies: list[float] = []
+async def open_tcp_connection(
+    host: str, port: int, timeout: float = 30.0
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Open a TCP connection for timing batches.
 
+    Nagle is disabled so batches are not coalesced, and the write buffer's
+    high-water mark is zero so drain() only returns once the kernel has
+    taken the whole batch: batch latencies include the flush.
+    """
     try:
         reader, writer = await asyncio.wait_for(
             asyncio.open_connection(host, port), timeout=timeout
@@ -111,25 +304,55 @@ async def send_messages_tcp(
     except asyncio.TimeoutError:
         raise ConnectionError(f"Timeout connecting to {host}:{port}")
 
+    writer.transport.set_write_buffer_limits(high=0)
+
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+    return reader, writer
+
+
+def frame_tcp_batch(msgs: list[bytes]) -> bytes:
+    """Newline-frame a batch into one buffer, written with a single send(2).
+
+    Cheaper than a framed copy per message gathered into a 100-entry sendmsg(2).
+    """
+    return b"\n".join(msgs) + b"\n"
+
+
+async def send_tcp_batch(writer: asyncio.StreamWriter, msgs: list[bytes]) -> None:
+    """Write a batch newline-framed as one buffer and wait for it to drain."""
+    writer.write(frame_tcp_batch(msgs))
+    await writer.drain()
+
+
+async def send_messages_tcp(
+    host: str,
+    port: int,
+    count: int,
+    batch_size: int = 100,
+    timeout: float = 30.0,
+    first_seq: int = 1,
+) -> tuple[float, list[int]]:
+    """Send messages via TCP and return duration and per-batch latencies in ns."""
+    latencies: list[int] = []
+    payloads = [
+        frame_tcp_batch(batch) for batch in generate_batches(count, batch_size, first_seq)
+    ]
+
+    _, writer = await open_tcp_connection(host, port, timeout)
+
     start_time = time.perf_counter()
 
     try:
-        for batch_start in range(0, count, batch_size):
-            batch_end = min(batch_start + batch_size, count)
-            batch_start_time = time.perf_counter()
-
-            for i in range(batch_start, batch_end):
-                msg = generate_rfc5424_message(i + 1)
-                writer.write(msg + b"\n")
+        for payload in payloads:
+            batch_start_ns = time.perf_counter_ns()
 
+            writer.write(payload)
             await writer.drain()
 
-            batch_latency = (time.perf_counter() - batch_start_time) * 1000
-            latencies.append(batch_latency)
-
-            # Small yield to allow event loop processing
-            if batch_start % 1000 == 0:
-                await asyncio.sleep(0.001)
+            latencies.append(time.perf_counter_ns() - batch_start_ns)
 
     finally:
         writer.close()
@@ -139,42 +362,132 @@ async def send_messages_tcp(
     return duration, latencies
 
 
-async def get_metrics(metrics_url: str, timeout: float = 10.0) -> dict[str, float]:
-    """Fetch Prometheus metrics from the forwarder."""
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            resp = await client.get(metrics_url)
-            resp.raise_for_status()
-        except Exception as e:
-            return {"error": str(e)}
+def _send_worker(
+    proto: str, host: str, port: int, count: int, first_seq: int, timeout: float, loop: str
+) -> tuple[float, list[int]]:
+    """Send one share of a parallel burst from a worker process."""
+    if proto == "udp":
+        return run_async(send_messages_udp(host, port, count, first_seq=first_seq), loop)
+    return run_async(
+        send_messages_tcp(host, port, count, timeout=timeout, first_seq=first_seq), loop
+    )
+
+
+async def send_messages_parallel(
+    proto: str,
+    host: str,
+    port: int,
+    count: int,
+    workers: int,
+    timeout: float = 30.0,
+    loop: str = "uvloop",
+    batch_size: int = 100,
+) -> tuple[float, list[int]]:
+    """Send a burst from several processes, each with its own socket and sequence range.
+
+    A single sender is bound to one interpreter; splitting the burst across
+    processes lets the offered load exceed it. Shares are whole batches, so
+    only the last one can end in a partial batch and the merged latencies
+    line up with calculate_results' batch accounting. The duration is that
+    of the slowest worker.
+    """
+    batches = -(-count // batch_size)
+    bounds = [min(batches * k // workers * batch_size, count) for k in range(workers + 1)]
+    shares = [(start, end - start) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    running_loop = asyncio.get_running_loop()
+    # Spawned, not forked from a process with a running event loop
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shares), mp_context=context) as pool:
+        results = await asyncio.gather(
+            *(
+                running_loop.run_in_executor(
+                    pool, _send_worker, proto, host, port, n, start + 1, timeout, loop
+                )
+                for start, n in shares
+            )
+        )
+
+    duration = max(worker_duration for worker_duration, _ in results)
+    latencies = [latency for _, worker_latencies in results for latency in worker_latencies]
+    return duration, latencies
+
+
+# Counters the test reports on; samples of every other metric are skipped
+_REPORTED_METRICS = (
+    "syslog_messages_received_total",
+    "syslog_messages_forwarded_total",
+    "syslog_messages_dropped_total",
+)
+
+# Sample line of the Prometheus text format for a reported counter: base name,
+# optional labels and the value after the last space
+_METRIC_SAMPLE = re.compile(
+    rb"^(%s)(?:{[^\n]*)? ([^ \n]+)$" % b"|".join(name.encode() for name in _REPORTED_METRICS),
+    re.MULTILINE,
+)
+
+
+async def get_metrics(client: httpx.AsyncClient, metrics_url: str) -> dict[str, float]:
+    """Fetch the reported counters from the forwarder, summed over their labels.
+
+    The client is shared across calls, so its connection is kept alive
+    between reports.
+    """
+    try:
+        resp = await client.get(metrics_url)
+        resp.raise_for_status()
+    except Exception as e:
+        return {"error": str(e)}
 
     metrics: dict[str, float] = {}
-    for line in resp.text.split("\n"):
-        if line.startswith("#") or not line.strip():
-            continue
+    # One scan over the raw body instead of splitting it into lines; lines of
+    # other metrics fail on their first characters
+    for match in _METRIC_SAMPLE.finditer(resp.content):
+        base_name, value = match.groups()
         try:
-            name, value = line.rsplit(" ", 1)
-            # Extract base metric name
-            base_name = name.split("{")[0]
-            metrics[base_name] = metrics.get(base_name, 0) + float(value)
-        except (ValueError, IndexError):
+            sample = float(value)
+        except ValueError:
             continue
+        name = base_name.decode()
+        metrics[name] = metrics.get(name, 0) + sample
 
     return metrics
 
 
+# Latency percentiles reported unless --percentiles says otherwise
+DEFAULT_PERCENTILES = (50.0, 95.0, 99.0)
+
+
+def _latency_at(per_batch: list[tuple[float, int]], rank: int) -> float:
+    """Latency of the message at rank in the sorted per-message latencies."""
+    for latency, messages in per_batch:
+        if rank < messages:
+            return latency
+        rank -= messages
+    return per_batch[-1][0]
+
+
 def calculate_results(
     count: int,
     duration: float,
-    latencies: list[float],
+    latencies_ns: list[int],
     metrics_before: dict[str, float],
     metrics_after: dict[str, float],
+    percentiles: tuple[float, ...] = DEFAULT_PERCENTILES,
 ) -> PerfResults:
     """Calculate performance results from raw data."""
-    # Per-message latencies (approximate from batch)
+    # Per-message latencies (approximate from batch): every message in a batch
+    # gets the batch latency / batch_size. Kept as one (latency, messages) pair
+    # per batch instead of expanding to one float per message, and converted
+    # from integer nanoseconds to milliseconds only here.
     batch_size = 100
-    per_msg_latencies = [lat / batch_size for lat in latencies for _ in range(batch_size)]
-    per_msg_latencies = per_msg_latencies[:count]  # Trim to exact count
+    per_batch = sorted(
+        (lat / (batch_size * 1_000_000), min(batch_size, count - i * batch_size))
+        for i, lat in enumerate(latencies_ns)
+        if count > i * batch_size  # Trim to exact count
+    )
+    total = sum(n for _, n in per_batch)
 
     received_before = metrics_before.get("syslog_messages_received_total", 0)
     received_after = metrics_after.get("syslog_messages_received_total", 0)
@@ -183,16 +496,14 @@ def calculate_results(
     dropped_before = metrics_before.get("syslog_messages_dropped_total", 0)
     dropped_after = metrics_after.get("syslog_messages_dropped_total", 0)
 
-    sorted_latencies = sorted(per_msg_latencies)
-
     return PerfResults(
         total_messages=count,
         duration_seconds=duration,
         messages_per_second=count / duration if duration > 0 else 0,
-        avg_latency_ms=statistics.mean(per_msg_latencies) if per_msg_latencies else 0,
-        p50_latency_ms=sorted_latencies[int(len(sorted_latencies) * 0.50)] if sorted_latencies else 0,
-        p95_latency_ms=sorted_latencies[int(len(sorted_latencies) * 0.95)] if sorted_latencies else 0,
-        p99_latency_ms=sorted_latencies[int(len(sorted_latencies) * 0.99)] if sorted_latencies else 0,
+        avg_latency_ms=sum(lat * n for lat, n in per_batch) / total if total else 0,
+        latency_percentiles_ms={
+            p: _latency_at(per_batch, int(total * p / 100)) if total else 0 for p in percentiles
+        },
         messages_received=int(received_after - received_before),
         messages_forwarded=int(forwarded_after - forwarded_before),
         messages_dropped=int(dropped_after - dropped_before),
@@ -211,10 +522,10 @@ def print_results(results: PerfResults, protocol: str) -> None:
     click.echo(f"   Messages/second:    {results.messages_per_second:,.0f}")
 
     click.echo(f"\n⏱️  Latency (per message, estimated):")
-    click.echo(f"   Average:            {results.avg_latency_ms:.3f}ms")
-    click.echo(f"   P50:                {results.p50_latency_ms:.3f}ms")
-    click.echo(f"   P95:                {results.p95_latency_ms:.3f}ms")
-    click.echo(f"   P99:                {results.p99_latency_ms:.3f}ms")
+    click.echo(f"   Average:            {results.avg_latency_ms * 1000:.1f}µs")
+    for percentile, latency in results.latency_percentiles_ms.items():
+        label = f"P{percentile:g}:"
+        click.echo(f"   {label:<20}{latency * 1000:.1f}µs")
 
     click.echo(f"\n📈 Forwarder Metrics:")
     click.echo(f"   Received:           {results.messages_received:,}")
@@ -274,73 +585,99 @@ async def run_long_test(
     start_time = time.perf_counter()
     interval_num = 0
 
+    # One metrics client for the whole run
+    client = httpx.AsyncClient(timeout=10.0)
+
     # Get initial metrics
-    metrics_prev = await get_metrics(metrics_url)
+    metrics_prev = await get_metrics(client, metrics_url)
     if "error" in metrics_prev:
         metrics_prev = {}
 
-    while not stop_requested:
-        elapsed = time.perf_counter() - start_time
-        if elapsed >= duration_seconds:
-            break
+    udp_sock: socket.socket | None = None
+    tcp_writer: asyncio.StreamWriter | None = None
 
-        interval_num += 1
-        interval_start = time.perf_counter()
+    async def send_batch(msgs: list[bytes]) -> None:
+        if udp_sock is not None:
+            await send_udp_batch(udp_sock, msgs)
+        else:
+            assert tcp_writer is not None
+            await send_tcp_batch(tcp_writer, msgs)
 
-        # Send messages for this interval
+    try:
+        # One UDP socket for the whole run
         if protocol == "udp":
-            _, _ = await send_messages_udp(host, port, interval_messages, batch_size=100)
-        else:
-            _, _ = await send_messages_tcp(host, port, interval_messages, batch_size=100)
+            udp_sock = open_udp_socket(host, port)
 
-        interval_duration = time.perf_counter() - interval_start
-        total_sent += interval_messages
+        # And one TCP connection, keeping its congestion window between intervals
+        if protocol == "tcp":
+            _, tcp_writer = await open_tcp_connection(host, port)
 
-        # Wait for the rest of the interval if we finished early
-        remaining = report_interval - interval_duration
-        if remaining > 0:
-            await asyncio.sleep(remaining)
+        while not stop_requested:
+            elapsed = time.perf_counter() - start_time
+            if elapsed >= duration_seconds:
+                break
 
-        # Get metrics
-        metrics_now = await get_metrics(metrics_url)
-        if "error" in metrics_now:
-            metrics_now = metrics_prev.copy()
+            interval_num += 1
+            interval_start = time.perf_counter()
 
-        received = int(
-            metrics_now.get("syslog_messages_received_total", 0)
-            - metrics_prev.get("syslog_messages_received_total", 0)
-        )
-        forwarded = int(
-            metrics_now.get("syslog_messages_forwarded_total", 0)
-            - metrics_prev.get("syslog_messages_forwarded_total", 0)
-        )
-        total_received += received
-        total_forwarded += forwarded
-
-        success_rate = (forwarded / interval_messages * 100) if interval_messages > 0 else 0
-        actual_rate = interval_messages / interval_duration if interval_duration > 0 else 0
-
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        stats = IntervalStats(
-            interval_num=interval_num,
-            timestamp=timestamp,
-            messages_sent=interval_messages,
-            duration_seconds=interval_duration,
-            messages_per_second=actual_rate,
-            messages_received=received,
-            messages_forwarded=forwarded,
-            success_rate=success_rate,
-        )
-        all_stats.append(stats)
+            # Send messages for this interval, paced at the target rate
+            await send_paced(send_batch, interval_messages, rate, first_seq=total_sent + 1)
 
-        # Print interval stats
-        click.echo(
-            f"{interval_num:>8} | {timestamp:>12} | {interval_messages:>10,} | "
-            f"{actual_rate:>10,.0f} | {received:>10,} | {forwarded:>10,} | "
-            f"{success_rate:>7.1f}%"
-        )
+            interval_duration = time.perf_counter() - interval_start
+            total_sent += interval_messages
+
+            # Wait for the rest of the interval if we finished early
+            remaining = report_interval - interval_duration
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+            # Get metrics
+            metrics_now = await get_metrics(client, metrics_url)
+            if "error" in metrics_now:
+                metrics_now = metrics_prev.copy()
+
+            received = int(
+                metrics_now.get("syslog_messages_received_total", 0)
+                - metrics_prev.get("syslog_messages_received_total", 0)
+            )
+            forwarded = int(
+                metrics_now.get("syslog_messages_forwarded_total", 0)
+                - metrics_prev.get("syslog_messages_forwarded_total", 0)
+            )
+            total_received += received
+            total_forwarded += forwarded
+
+            success_rate = (forwarded / interval_messages * 100) if interval_messages > 0 else 0
+            actual_rate = interval_messages / interval_duration if interval_duration > 0 else 0
+
+            timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
+            stats = IntervalStats(
+                interval_num=interval_num,
+                timestamp=timestamp,
+                messages_sent=interval_messages,
+                duration_seconds=interval_duration,
+                messages_per_second=actual_rate,
+                messages_received=received,
+                messages_forwarded=forwarded,
+                success_rate=success_rate,
+            )
+            all_stats.append(stats)
 
-        metrics_prev = metrics_now
+            # Print interval stats
+            click.echo(
+                f"{interval_num:>8} | {timestamp:>12} | {interval_messages:>10,} | "
+                f"{actual_rate:>10,.0f} | {received:>10,} | {forwarded:>10,} | "
+                f"{success_rate:>7.1f}%"
+            )
+
+            metrics_prev = metrics_now
+    finally:
+        if udp_sock is not None:
+            udp_sock.close()
+        if tcp_writer is not None:
+            tcp_writer.close()
+            await tcp_writer.wait_closed()
+        await client.aclose()
 
     # Print summary
     total_duration = time.perf_counter() - start_time
@@ -372,6 +709,17 @@ async def run_long_test(
     click.echo("=" * 90 + "\n")
 
 
+def _parse_percentiles(ctx: click.Context, param: click.Parameter, value: str) -> tuple[float, ...]:
+    """Parse a comma-separated percentile list such as "50,95,99.9"."""
+    try:
+        percentiles = tuple(float(p) for p in value.split(","))
+    except ValueError:
+        raise click.BadParameter(f"'{value}' is not a comma-separated list of numbers")
+    if not all(0 < p <= 100 for p in percentiles):
+        raise click.BadParameter("percentiles must be in (0, 100]")
+    return percentiles
+
+
 @click.command()
 @click.option("--host", "-h", default="localhost", help="Forwarder host.")
 @click.option("--port", "-p", default=5514, type=int, help="Forwarder port.")
@@ -383,6 +731,27 @@ async def run_long_test(
 @click.option("--metrics-url", "-m", default="http://localhost:9090/metrics", help="Prometheus metrics URL.")
 @click.option("--warmup", "-w", default=100, type=int, help="Warmup messages before test.")
 @click.option("--timeout", "-t", default=60.0, type=float, help="Test timeout in seconds (burst mode).")
+@click.option(
+    "--percentiles",
+    default="50,95,99",
+    callback=_parse_percentiles,
+    help="Latency percentiles to report (burst mode).",
+)
+@click.option(
+    "--workers", default=1, type=click.IntRange(min=1), help="Sender processes (burst mode)."
+)
+@click.option(
+    "--loop",
+    type=click.Choice(["uvloop", "asyncio"]),
+    default="uvloop",
+    help="Sender event loop (asyncio if uvloop is not installed).",
+)
+@click.option(
+    "--cpu",
+    default=None,
+    type=int,
+    help="Pin the sender to this CPU (Linux); run the forwarder on others.",
+)
 def main(
     host: str,
     port: int,
@@ -394,6 +763,10 @@ def main(
     metrics_url: str,
     warmup: int,
     timeout: float,
+    percentiles: tuple[float, ...],
+    workers: int,
+    loop: str,
+    cpu: int | None,
 ) -> None:
     """Run performance test for syslog-fwd.
 
@@ -408,6 +781,14 @@ def main(
     """
     # Determine mode
     long_running = duration > 0
+    if uvloop is None:
+        loop = "asyncio"
+
+    # Keep the sender's own CPU use off the forwarder's cores
+    if cpu is not None:
+        if not hasattr(os, "sched_setaffinity"):
+            raise click.UsageError("--cpu is only supported on Linux")
+        os.sched_setaffinity(0, {cpu})
 
     click.echo("=" * 60)
     click.echo("SYSLOG FORWARDER PERFORMANCE TEST")
@@ -425,9 +806,14 @@ def main(
         click.echo(f"  Mode:            BURST")
         click.echo(f"  Message count:   {count:,}")
         click.echo(f"  Warmup:          {warmup} messages")
+        if workers > 1:
+            click.echo(f"  Sender workers:  {workers}")
 
     click.echo(f"  Transform:       remove 2 fields (proc_id, msg_id)")
     click.echo(f"  Metrics URL:     {metrics_url}")
+    click.echo(f"  Event loop:      {loop}")
+    if cpu is not None:
+        click.echo(f"  Sender CPU:      {cpu}")
 
     if long_running:
         # Long-running mode
@@ -436,10 +822,11 @@ def main(
             click.echo("\n⚠️  Long-running mode only supports single protocol, using UDP")
 
         try:
-            asyncio.run(
+            run_async(
                 run_long_test(
                     host, port, proto, duration, rate, report_interval, metrics_url
-                )
+                ),
+                loop,
             )
         except KeyboardInterrupt:
             click.echo("\n⚠️  Test interrupted")
@@ -451,52 +838,69 @@ def main(
         async def run_burst_test() -> None:
             protocols_to_test = ["udp", "tcp"] if protocol == "both" else [protocol]
 
-            for proto in protocols_to_test:
-                click.echo(f"\n🚀 Starting {proto.upper()} test...")
-
-                # Warmup
-                if warmup > 0:
-                    click.echo(f"   Warming up with {warmup} messages...")
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                for proto in protocols_to_test:
                     if proto == "udp":
-                        await send_messages_udp(host, port, warmup)
+                        # One socket for warmup and measurement
+                        with open_udp_socket(host, port) as udp_sock:
+                            await run_protocol_test(client, proto, udp_sock)
                     else:
-                        await send_messages_tcp(host, port, warmup, timeout=timeout)
-                    await asyncio.sleep(1)  # Let forwarder process warmup
-
-                # Get metrics before test
-                click.echo("   Fetching baseline metrics...")
-                metrics_before = await get_metrics(metrics_url)
-                if "error" in metrics_before:
-                    click.echo(f"   ⚠️  Could not fetch metrics: {metrics_before['error']}")
-                    metrics_before = {}
-
-                # Run test
-                click.echo(f"   Sending {count:,} messages...")
+                        await run_protocol_test(client, proto, None)
+
+        async def run_protocol_test(
+            client: httpx.AsyncClient, proto: str, udp_sock: socket.socket | None
+        ) -> None:
+            click.echo(f"\n🚀 Starting {proto.upper()} test...")
+
+            # Warmup
+            if warmup > 0:
+                click.echo(f"   Warming up with {warmup} messages...")
                 if proto == "udp":
-                    test_duration, latencies = await send_messages_udp(host, port, count)
+                    await send_messages_udp(host, port, warmup, sock=udp_sock)
                 else:
-                    test_duration, latencies = await send_messages_tcp(
-                        host, port, count, timeout=timeout
-                    )
-
-                # Wait for processing
-                click.echo("   Waiting for processing to complete...")
-                await asyncio.sleep(2)
-
-                # Get metrics after test
-                metrics_after = await get_metrics(metrics_url)
-                if "error" in metrics_after:
-                    click.echo(f"   ⚠️  Could not fetch metrics: {metrics_after['error']}")
-                    metrics_after = {}
-
-                # Calculate and print results
-                results = calculate_results(
-                    count, test_duration, latencies, metrics_before, metrics_after
+                    await send_messages_tcp(host, port, warmup, timeout=timeout)
+                await asyncio.sleep(1)  # Let forwarder process warmup
+
+            # Get metrics before test
+            click.echo("   Fetching baseline metrics...")
+            metrics_before = await get_metrics(client, metrics_url)
+            if "error" in metrics_before:
+                click.echo(f"   ⚠️  Could not fetch metrics: {metrics_before['error']}")
+                metrics_before = {}
+
+            # Run test
+            click.echo(f"   Sending {count:,} messages...")
+            if workers > 1:
+                test_duration, latencies = await send_messages_parallel(
+                    proto, host, port, count, workers, timeout=timeout, loop=loop
+                )
+            elif proto == "udp":
+                test_duration, latencies = await send_messages_udp(
+                    host, port, count, sock=udp_sock
+                )
+            else:
+                test_duration, latencies = await send_messages_tcp(
+                    host, port, count, timeout=timeout
                 )
-                print_results(results, proto)
+
+            # Wait for processing
+            click.echo("   Waiting for processing to complete...")
+            await asyncio.sleep(2)
+
+            # Get metrics after test
+            metrics_after = await get_metrics(client, metrics_url)
+            if "error" in metrics_after:
+                click.echo(f"   ⚠️  Could not fetch metrics: {metrics_after['error']}")
+                metrics_after = {}
+
+            # Calculate and print results
+            results = calculate_results(
+                count, test_duration, latencies, metrics_before, metrics_after, percentiles
+            )
+            print_results(results, proto)
 
         try:
-            asyncio.run(asyncio.wait_for(run_burst_test(), timeout=timeout * 2))
+            run_async(asyncio.wait_for(run_burst_test(), timeout=timeout * 2), loop)
         except asyncio.TimeoutError:
             click.echo(f"\n❌ Test timed out after {timeout * 2}s", err=True)
             raise SystemExit(1)
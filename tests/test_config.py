@@ -12,6 +12,7 @@ from syslog_fwd.config import (
     FilterConfig,
     FilterMatch,
     InputConfig,
+    MetricsConfig,
     Protocol,
     Facility,
     Severity,
@@ -30,6 +31,23 @@ class TestInputConfig:
         assert config.host == "0.0.0.0"
         assert config.port == 514
 
+    def test_frozen(self):
+        """Test that inputs are immutable so cached host/port stay consistent."""
+        config = InputConfig(name="test", address="0.0.0.0:514")
+        with pytest.raises(ValueError):
+            config.address = "0.0.0.0:1514"
+
+    def test_udp_queue_defaults(self):
+        """Test UDP queue size, worker and socket count defaults and bounds."""
+        config = InputConfig(name="test", address="0.0.0.0:514")
+        assert config.queue_size == 10000
+        assert config.workers == 4
+        assert config.sockets == 1
+        assert config.reuse_port is False
+
+        with pytest.raises(ValueError):
+            InputConfig(name="test", address="0.0.0.0:514", workers=0)
+
     def test_invalid_address_no_port(self):
         """Test that address without port raises error."""
         with pytest.raises(ValueError, match="host:port"):
@@ -80,11 +98,23 @@ class TestFilterMatch:
         match = FilterMatch(message_pattern=r"error|warning")
         assert match.message_pattern == "error|warning"
 
+    def test_patterns_compiled_at_validation(self):
+        """Test that regex patterns are compiled once and exposed."""
+        match = FilterMatch(message_pattern=r"error|warning")
+        assert match.message_regex.search("disk error")
+        assert match.hostname_regex is None
+
     def test_invalid_regex_pattern(self):
         """Test invalid regex pattern raises error."""
         with pytest.raises(ValueError, match="Invalid regex"):
             FilterMatch(message_pattern=r"[invalid")
 
+    def test_patterns_shared_across_configs(self):
+        """Test that equal patterns reuse one compiled regex."""
+        first = FilterMatch(message_pattern=r"error|warning")
+        second = FilterMatch(message_pattern=r"error|warning")
+        assert first.message_regex is second.message_regex
+
     def test_facility_filter(self):
         """Test facility filter."""
         match = FilterMatch(facility=[Facility.AUTH, Facility.AUTHPRIV])
@@ -112,6 +142,21 @@ class TestDestinationConfig:
         assert config.retry.backoff_seconds == 1.0
 
 
+class TestMetricsConfig:
+    """Tests for MetricsConfig model."""
+
+    def test_host_and_port(self):
+        """Test that metrics address is split into host and port."""
+        config = MetricsConfig(address="127.0.0.1:9100")
+        assert config.host == "127.0.0.1"
+        assert config.port == 9100
+
+    def test_invalid_address(self):
+        """Test that metrics address is validated like other addresses."""
+        with pytest.raises(ValueError, match="host:port"):
+            MetricsConfig(address="localhost")
+
+
 class TestConfig:
     """Tests for root Config model."""
 
@@ -125,6 +170,16 @@ class TestConfig:
                 destinations=[],
             )
 
+    def test_validate_transform_references(self):
+        """Test that invalid transform references are caught."""
+        with pytest.raises(ValueError, match="Filter 'test' references unknown transform 'nope'"):
+            Config(
+                filters=[
+                    FilterConfig(name="test", destinations=["central"], transforms=["nope"])
+                ],
+                destinations=[DestinationConfig(name="central", address="localhost:514")],
+            )
+
     def test_valid_config(self):
         """Test valid complete configuration."""
         config = Config(
@@ -146,6 +201,12 @@ class TestConfig:
 class TestLoadConfig:
     """Tests for load_config function."""
 
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path, monkeypatch):
+        """Keep the config cache out of the user's home directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        return tmp_path / "cache" / "syslog-fwd"
+
     def test_load_valid_config(self):
         """Test loading a valid configuration file."""
         config_content = """
@@ -237,3 +298,106 @@ destinations:
                 assert config.service.log_level == "info"
             finally:
                 os.unlink(f.name)
+
+
+class TestConfigCache:
+    """Tests for the on-disk config cache."""
+
+    CONFIG = """
+version: "1"
+destinations:
+  - name: test
+    address: "default.example.com:514"
+"""
+
+    ENV_CONFIG = CONFIG.replace("default.example.com", "${CACHE_TEST_HOST:-default.example.com}")
+
+    @pytest.fixture
+    def config_file(self, tmp_path, monkeypatch):
+        """Write a config file and point the cache at a temp directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.delenv("CACHE_TEST_HOST", raising=False)
+        path = tmp_path / "config.yaml"
+        path.write_text(self.CONFIG)
+        return path
+
+    def test_cache_written_and_reused(self, config_file, tmp_path, monkeypatch):
+        """Test that a second load is served from the cache."""
+        first = load_config(config_file)
+        cache_files = list((tmp_path / "cache" / "syslog-fwd").glob("*.json"))
+        assert len(cache_files) == 1
+
+        import syslog_fwd.config as config_module
+
+        config_module._load_config_cached.cache_clear()
+        monkeypatch.setattr(config_module.yaml, "load", None)  # YAML must not be parsed
+        second = load_config(config_file)
+        assert second == first
+
+    def test_repeated_load_returns_same_instance(self, config_file):
+        """Test that in-process loads of an unchanged file are memoized."""
+        assert load_config(config_file) is load_config(config_file)
+
+    def test_config_is_frozen(self, config_file):
+        """Test that shared Config instances cannot be mutated."""
+        config = load_config(config_file)
+        with pytest.raises(ValueError):
+            config.version = "2"
+
+    def test_cache_file_is_private(self, config_file, tmp_path):
+        """Test that cache entries are readable by their owner only."""
+        load_config(config_file)
+        (cache_file,) = (tmp_path / "cache" / "syslog-fwd").glob("*.json")
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+
+    def test_substituted_config_not_written(self, config_file, tmp_path, monkeypatch):
+        """Test that expanded environment values never reach the on-disk cache."""
+        config_file.write_text(self.ENV_CONFIG)
+        monkeypatch.setenv("CACHE_TEST_HOST", "secret.example.com")
+
+        assert load_config(config_file).destinations[0].host == "secret.example.com"
+        assert not list((tmp_path / "cache").rglob("*.json"))
+
+    def test_env_change_invalidates_cache(self, config_file, monkeypatch):
+        """Test that changing a referenced env var is not masked by the cache."""
+        config_file.write_text(self.ENV_CONFIG)
+        assert load_config(config_file).destinations[0].host == "default.example.com"
+        monkeypatch.setenv("CACHE_TEST_HOST", "other.example.com")
+        assert load_config(config_file).destinations[0].host == "other.example.com"
+
+    def test_file_change_invalidates_cache(self, config_file):
+        """Test that editing the file is picked up."""
+        load_config(config_file)
+        config_file.write_text(self.CONFIG.replace(":514", ":1514"))
+        assert load_config(config_file).destinations[0].port == 1514
+
+    def test_corrupt_cache_is_ignored(self, config_file, tmp_path):
+        """Test that an unreadable cache entry falls back to parsing."""
+        load_config(config_file)
+        for cache_file in (tmp_path / "cache" / "syslog-fwd").glob("*.json"):
+            cache_file.write_bytes(b"garbage")
+
+        import syslog_fwd.config as config_module
+
+        config_module._load_config_cached.cache_clear()
+        assert load_config(config_file).destinations[0].port == 514
+
+    def test_no_home_directory_skips_cache(self, config_file, monkeypatch):
+        """Test that a missing cache directory only disables the disk cache."""
+        import pwd
+
+        def unknown_uid(uid):
+            raise KeyError(uid)
+
+        monkeypatch.delenv("XDG_CACHE_HOME")
+        monkeypatch.delenv("HOME", raising=False)
+        monkeypatch.setattr(pwd, "getpwuid", unknown_uid)
+        with pytest.raises(RuntimeError):
+            Path.home()
+
+        assert load_config(config_file).destinations[0].port == 514
+
+    def test_cache_disabled(self, config_file, tmp_path):
+        """Test that use_cache=False leaves no cache behind."""
+        load_config(config_file, use_cache=False)
+        assert not (tmp_path / "cache").exists()
@@ -1,11 +1,17 @@
 """Tests for filter engine."""
 
+import re
 from datetime import datetime
 
 import pytest
+from prometheus_client import REGISTRY
 
 from syslog_fwd.config import Facility, FilterConfig, FilterMatch, Severity
-from syslog_fwd.filters import FilterEngine
+from syslog_fwd.filters import (
+    LATENCY_SAMPLE_INTERVAL,
+    MAX_CACHED_HOSTNAME_LENGTH,
+    FilterEngine,
+)
 from syslog_fwd.parser import SyslogMessage
 
 
@@ -223,6 +229,169 @@ class TestFilterEngine:
         result = engine.evaluate(make_message(message="user admin logged in successfully"))
         assert result.filter_name == "default"
 
+    def test_literal_patterns(self):
+        """Test patterns without regex metacharacters match as substrings."""
+        filters = [
+            FilterConfig(
+                name="web-errors",
+                match=FilterMatch(hostname_pattern="web", message_pattern="disk full"),
+                destinations=["ops"],
+            ),
+            FilterConfig(name="default", destinations=["central"]),
+        ]
+        engine = FilterEngine(filters)
+
+        result = engine.evaluate(make_message(hostname="prod-web-01", message="/var: disk full"))
+        assert result.filter_name == "web-errors"
+
+        result = engine.evaluate(make_message(hostname="prod-db-01", message="/var: disk full"))
+        assert result.filter_name == "default"
+
+        result = engine.evaluate(make_message(hostname=None, message="/var: disk full"))
+        assert result.filter_name == "default"
+
+    def test_required_literal_prefilter(self):
+        """Test that the substring precheck does not change regex match results."""
+        filters = [
+            FilterConfig(
+                name="ssh-failures",
+                match=FilterMatch(message_pattern=r"Failed password for \w+ from"),
+                destinations=["security"],
+            ),
+            FilterConfig(
+                name="colors",
+                match=FilterMatch(message_pattern=r"colou?r"),
+                destinations=["ui"],
+            ),
+            FilterConfig(
+                name="log-files",
+                match=FilterMatch(message_pattern=r"\w+\.log\b"),
+                destinations=["files"],
+            ),
+            FilterConfig(name="default", destinations=["central"]),
+        ]
+        engine = FilterEngine(filters)
+
+        result = engine.evaluate(make_message(message="Failed password for root from 10.0.0.1"))
+        assert result.filter_name == "ssh-failures"
+
+        result = engine.evaluate(make_message(message="Failed password for  from 10.0.0.1"))
+        assert result.filter_name == "default"
+
+        assert engine.evaluate(make_message(message="color")).filter_name == "colors"
+        assert engine.evaluate(make_message(message="colour")).filter_name == "colors"
+        assert engine.evaluate(make_message(message="colr")).filter_name == "default"
+
+        assert engine.evaluate(make_message(message="rotated app.log")).filter_name == "log-files"
+        assert engine.evaluate(make_message(message="rotated app_log")).filter_name == "default"
+
+    def test_escaped_patterns_match_like_re(self):
+        """Test that hex, octal and named escapes keep their regex meaning."""
+        cases = [
+            (r"web\x2d01", ["web-01", "web\\x2d01", "2d01"]),
+            (r"\101BC", ["ABC", "01BC", "xABCx"]),
+            (r"a\012b", ["a\nb", "12b", "a\\012b"]),
+            (r"\N{HYPHEN-MINUS}\d+", ["id-42", "id-", "N42"]),
+        ]
+        for pattern, texts in cases:
+            engine = FilterEngine(
+                [
+                    FilterConfig(
+                        name="hostname",
+                        match=FilterMatch(hostname_pattern=pattern),
+                        destinations=["a"],
+                    ),
+                    FilterConfig(
+                        name="message",
+                        match=FilterMatch(message_pattern=pattern),
+                        destinations=["b"],
+                    ),
+                ]
+            )
+            for text in texts:
+                expected = re.search(pattern, text) is not None
+                result = engine.evaluate(make_message(hostname=text, message="-"))
+                assert (result.filter_name == "hostname") is expected, (pattern, text)
+                result = engine.evaluate(make_message(hostname=None, message=text))
+                assert (result.filter_name == "message") is expected, (pattern, text)
+
+    def test_empty_hostname_pattern_is_ignored(self):
+        """Test that an empty hostname pattern does not require a hostname."""
+        filters = [
+            FilterConfig(
+                name="any-host",
+                match=FilterMatch(hostname_pattern=""),
+                destinations=["central"],
+            ),
+        ]
+        engine = FilterEngine(filters)
+
+        result = engine.evaluate(make_message(hostname=None))
+        assert result.filter_name == "any-host"
+
+    def test_repeated_priority_uses_cached_decision(self):
+        """Test that cached (facility, severity) decisions keep first-match order."""
+        filters = [
+            FilterConfig(
+                name="drop-debug",
+                match=FilterMatch(severity=[Severity.DEBUG]),
+                action="drop",
+            ),
+            FilterConfig(
+                name="errors",
+                match=FilterMatch(message_pattern="error"),
+                destinations=["alerts"],
+            ),
+            FilterConfig(name="default", destinations=["central"]),
+        ]
+        engine = FilterEngine(filters)
+
+        for _ in range(2):
+            assert engine.evaluate(make_message(severity=7, message="error")).filter_name == (
+                "drop-debug"
+            )
+            assert engine.evaluate(make_message(severity=6, message="error")).filter_name == (
+                "errors"
+            )
+            assert engine.evaluate(make_message(severity=6, message="ok")).filter_name == (
+                "default"
+            )
+
+    def test_hostname_decisions_are_cached(self, monkeypatch):
+        """Test that per-hostname caching keeps results and is bounded."""
+        monkeypatch.setattr("syslog_fwd.filters.MAX_CACHED_HOSTNAMES", 2)
+        filters = [
+            FilterConfig(
+                name="prod",
+                match=FilterMatch(hostname_pattern=r"^prod-\d+"),
+                destinations=["production"],
+            ),
+            FilterConfig(
+                name="errors",
+                match=FilterMatch(severity=[Severity.ERR], message_pattern="error"),
+                destinations=["alerts"],
+            ),
+            FilterConfig(name="default", destinations=["central"]),
+        ]
+        engine = FilterEngine(filters)
+
+        for _ in range(2):
+            for hostname in ("prod-1", "dev-1", None, "prod-2"):
+                expected = "prod" if hostname and hostname.startswith("prod") else "default"
+                assert engine.evaluate(make_message(hostname=hostname)).filter_name == expected
+
+        # Over-long hostnames are evaluated without being cached
+        monkeypatch.setattr("syslog_fwd.filters.MAX_CACHED_HOSTNAMES", 100)
+        long_hostname = "prod-1" + "x" * MAX_CACHED_HOSTNAME_LENGTH
+        for _ in range(2):
+            assert engine.evaluate(make_message(hostname=long_hostname)).filter_name == "prod"
+        assert engine._cached_hostnames == 2
+
+        # A message pattern among the candidates disables the hostname cache
+        for message, expected in (("error", "errors"), ("fine", "default")):
+            result = engine.evaluate(make_message(severity=3, hostname="dev-1", message=message))
+            assert result.filter_name == expected
+
     def test_filter_reload(self):
         """Test reloading filters."""
         initial_filters = [
@@ -261,3 +430,15 @@ class TestFilterEngine:
 
         result = engine.evaluate(make_message(severity=2))
         assert result.destinations == ["siem", "pagerduty", "archive"]
+
+    def test_latency_not_recorded_when_disabled(self):
+        """Test that no latency is observed with record_latency=False."""
+        filters = [FilterConfig(name="latency-off", destinations=["siem"])]
+        engine = FilterEngine(filters, record_latency=False)
+        for _ in range(LATENCY_SAMPLE_INTERVAL * 2):
+            engine.evaluate(make_message())
+
+        count = REGISTRY.get_sample_value(
+            "syslog_processing_latency_seconds_count", {"filter": "latency-off"}
+        )
+        assert not count
@@ -0,0 +1,61 @@
+"""Tests for the forwarder service."""
+
+import pytest
+from structlog.testing import capture_logs
+
+from syslog_fwd.config import Config, DestinationConfig, FilterConfig
+from syslog_fwd.forwarder import SyslogForwarder
+from syslog_fwd.parser import SyslogParser
+
+
+class _FakeOutput:
+    """Output stub whose send either succeeds, fails or raises."""
+
+    def __init__(self, outcome: bool | Exception) -> None:
+        self.outcome = outcome
+        self.sent = 0
+
+    async def send_with_retry(self, message) -> bool:
+        self.sent += 1
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def _forwarder(outcomes: dict[str, bool | Exception]) -> SyslogForwarder:
+    config = Config(
+        filters=[FilterConfig(name="all", destinations=list(outcomes))],
+        destinations=[
+            DestinationConfig(name=name, protocol="udp", address="127.0.0.1:5514")
+            for name in outcomes
+        ],
+    )
+    forwarder = SyslogForwarder(config)
+    forwarder.outputs.clear()
+    forwarder.outputs.update({name: _FakeOutput(o) for name, o in outcomes.items()})
+    return forwarder
+
+
+class TestMessageFanOut:
+    """Tests for forwarding one message to its destinations."""
+
+    @pytest.mark.parametrize(
+        "outcomes",
+        [
+            {"broken": OSError("boom")},
+            {"ok": True, "broken": OSError("boom"), "down": False},
+        ],
+    )
+    async def test_send_errors_are_logged_per_destination(self, outcomes):
+        """Test that one or many destinations report errors the same way."""
+        forwarder = _forwarder(outcomes)
+        message = SyslogParser.parse(b"<13>1 - host app - - - hello")
+
+        with capture_logs() as logs:
+            await forwarder._handle_message(message)
+
+        assert all(output.sent == 1 for output in forwarder.outputs.values())
+        errors = [e for e in logs if e["event"] == "Error forwarding message"]
+        assert [(e["destination"], e["error"]) for e in errors] == [("broken", "boom")]
+        failures = [e["destination"] for e in logs if e["event"] == "Failed to forward message"]
+        assert failures == (["down"] if "down" in outcomes else [])
@@ -0,0 +1,119 @@
+"""Tests for syslog input listeners."""
+
+import socket
+
+import pytest
+
+from syslog_fwd.config import InputConfig, Protocol
+from syslog_fwd.inputs import TCPInput, TCPProtocol, UDPInput
+
+
+class TestTCPFraming:
+    """Tests for TCP message framing (RFC 6587)."""
+
+    def test_newline_framing(self):
+        """Test LF and CR+LF terminated messages are split in order."""
+        buffer = bytearray(b"<13>one\n<13>two\r\n<13>par")
+        end = len(buffer)
+
+        message, offset = TCPProtocol._extract_newline(buffer, 0, end)
+        assert message == b"<13>one"
+        message, offset = TCPProtocol._extract_newline(buffer, offset, end)
+        assert message == b"<13>two"
+        message, offset = TCPProtocol._extract_newline(buffer, offset, end)
+        assert message is None
+        assert buffer[offset:] == b"<13>par"
+
+    def test_octet_counted_framing(self):
+        """Test octet-counted frames may contain newlines."""
+        buffer = bytearray(b"9 <13>a\nb\nc5 <13>x")
+        end = len(buffer)
+
+        message, offset = TCPProtocol._extract_octet_counted(buffer, 0, end)
+        assert message == b"<13>a\nb\nc"
+        message, offset = TCPProtocol._extract_octet_counted(buffer, offset, end)
+        assert message == b"<13>x"
+        assert offset == end
+
+    def test_octet_counted_incomplete_frame_waits(self):
+        """Test a partial frame is not split at an embedded newline."""
+        for partial in (b"1", b"20 <13>partial\nmore"):
+            buffer = bytearray(partial)
+            message, offset = TCPProtocol._extract_octet_counted(buffer, 0, len(buffer))
+            assert message is None
+            assert offset == 0
+
+    def test_extract_respects_end(self):
+        """Test bytes past the received data are never framed."""
+        buffer = bytearray(b"<13>one\n\x00\x00")
+        message, offset = TCPProtocol._extract_newline(buffer, 0, 6)
+        assert message is None
+        assert offset == 0
+
+    def test_octet_counted_malformed_length_resyncs(self):
+        """Test invalid length prefixes fall back to newline framing."""
+        for frame in (b"-5 ab", b"+5 ab", b"1_0 ab", b"0 ab"):
+            buffer = bytearray(frame + b"\n5 <13>x")
+            end = len(buffer)
+
+            message, offset = TCPProtocol._extract_octet_counted(buffer, 0, end)
+            assert message == frame
+            assert offset == len(frame) + 1
+            message, offset = TCPProtocol._extract_octet_counted(buffer, offset, end)
+            assert message == b"<13>x"
+            assert offset == end
+
+    def test_octet_counted_oversized_frame_is_skipped(self):
+        """Test a frame over MAX_FRAME_SIZE is dropped without stalling the next one."""
+        buffer = bytearray(b"70000 <13>x5 <13>y")
+        message, offset = TCPProtocol._extract_octet_counted(buffer, 0, len(buffer))
+        assert message is None
+        assert offset == len(b"70000 ") + 70000
+
+        async def handler(message):
+            pass
+
+        protocol = TCPProtocol(TCPInput(InputConfig(name="tcp", protocol=Protocol.TCP), handler))
+        stream = b"70000 " + b"x" * 70000 + b"5 <13>y"
+        while stream:
+            view = protocol.get_buffer(-1)
+            chunk, stream = stream[: len(view)], stream[len(view) :]
+            view[: len(chunk)] = chunk
+            protocol.buffer_updated(len(chunk))
+
+        assert protocol._messages.get_nowait().message == "y"
+        assert protocol._messages.empty()
+
+
+class TestUDPInput:
+    """Tests for the UDP input listener."""
+
+    @pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="needs SO_REUSEPORT")
+    async def test_reuse_port_lets_inputs_share_the_port(self):
+        """Test that two listeners with reuse_port bind the same address."""
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        async def handler(message):
+            pass
+
+        config = InputConfig(name="udp", address=f"127.0.0.1:{port}", reuse_port=True)
+        first, second = UDPInput(config, handler), UDPInput(config, handler)
+        await first.start()
+        try:
+            await second.start()
+            await second.stop()
+        finally:
+            await first.stop()
+
+        # Without reuse_port the second bind fails
+        config = InputConfig(name="udp", address=f"127.0.0.1:{port}")
+        first, second = UDPInput(config, handler), UDPInput(config, handler)
+        await first.start()
+        try:
+            with pytest.raises(OSError):
+                await second.start()
+        finally:
+            await second.stop()
+            await first.stop()
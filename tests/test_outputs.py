@@ -0,0 +1,68 @@
+"""Tests for syslog output forwarders."""
+
+import asyncio
+
+from syslog_fwd.config import DestinationConfig, TransformConfig
+from syslog_fwd.outputs import UDPOutput
+from syslog_fwd.parser import SyslogParser
+from syslog_fwd.transformer import MessageTransformer
+
+
+def _udp_output(fmt: str) -> UDPOutput:
+    config = DestinationConfig(name="out", protocol="udp", address="127.0.0.1:5514", format=fmt)
+    return UDPOutput(config)
+
+
+class TestFormatMessage:
+    """Tests for destination message formatting."""
+
+    def test_same_format_passes_raw_through(self):
+        """Test an unmodified message is forwarded byte for byte."""
+        raw = b"<13>Feb  5 08:30:00 server kernel: Some kernel message"
+        message = SyslogParser.parse(raw)
+
+        assert _udp_output("auto")._format_message(message) == raw
+        assert _udp_output("rfc3164")._format_message(message) == raw
+        assert _udp_output("rfc5424")._format_message(message).startswith(b"<13>1 ")
+
+    def test_transformed_message_is_reencoded(self):
+        """Test a transformed message is not forwarded as its original bytes."""
+        raw = b"<34>1 2024-01-15T12:30:45Z host app - - - secret"
+        transformer = MessageTransformer(
+            [TransformConfig(name="prefix", message_prefix="[fwd] ")]
+        )
+        message = transformer.transform(SyslogParser.parse(raw), ["prefix"])
+
+        assert _udp_output("auto")._format_message(message).endswith(b"[fwd] secret")
+
+
+class TestUDPOutput:
+    """Tests for the UDP output forwarder."""
+
+    async def test_send_waits_while_writing_is_paused(self):
+        """Test senders wait for the transport buffer to drain instead of growing it."""
+        output = _udp_output("auto")
+        await output.connect()
+        try:
+            message = SyslogParser.parse(b"<13>1 - host app - - - hello")
+            output._protocol.pause_writing()
+            sends = [asyncio.create_task(output.send(message)) for _ in range(2)]
+            await asyncio.sleep(0)
+            assert not any(send.done() for send in sends)
+
+            sends[0].cancel()
+            output._protocol.resume_writing()
+            assert await sends[1] is True
+        finally:
+            await output.disconnect()
+
+    async def test_paused_send_fails_when_disconnected(self):
+        """Test a waiting sender is released when the endpoint closes."""
+        output = _udp_output("auto")
+        await output.connect()
+        output._protocol.pause_writing()
+        send = asyncio.create_task(output.send(SyslogParser.parse(b"<13>1 - h a - - - x")))
+        await asyncio.sleep(0)
+
+        await output.disconnect()
+        assert await send is False
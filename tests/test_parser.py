@@ -1,9 +1,15 @@
 """Tests for syslog message parser."""
 
 import pytest
+from dataclasses import replace
 from datetime import datetime
 
-from syslog_fwd.parser import SyslogParser, SyslogMessage
+from syslog_fwd.parser import (
+    MAX_SHARED_FIELD_LENGTH,
+    SyslogMessage,
+    SyslogParser,
+    _shared_fields,
+)
 
 
 class TestSyslogParser:
@@ -69,6 +75,15 @@ class TestSyslogParser:
         assert result.app_name == "kernel"
         assert result.proc_id is None
 
+    def test_parse_rfc3164_non_ascii_tag(self):
+        """Test parsing RFC 3164 with non-ASCII tag and message text."""
+        msg = "<13>Feb  5 08:30:00 server café[42]:  données reçues".encode()
+        result = SyslogParser.parse(msg)
+
+        assert result.app_name == "café"
+        assert result.proc_id == "42"
+        assert result.message == "données reçues"
+
     def test_parse_simple_message(self):
         """Test parsing a simple message with just PRI."""
         msg = b"<14>Simple message without standard format"
@@ -113,6 +128,12 @@ class TestSyslogParser:
         result = SyslogParser.parse(msg)
         assert result.severity_name == "crit"
 
+    def test_unknown_facility_name(self):
+        """Test facility_name for values outside the known table."""
+        result = SyslogParser.parse(b"<34>1 - - - - - - test")
+        result.facility = 42
+        assert result.facility_name == "unknown(42)"
+
     def test_to_rfc3164_output(self):
         """Test formatting message as RFC 3164."""
         msg = b"<34>1 2024-01-15T12:30:45Z hostname app 1234 - - Test message"
@@ -143,3 +164,33 @@ class TestSyslogParser:
         msg = b"<14>1 - - - - - - Test\r\n"
         result = SyslogParser.parse(msg)
         assert result.message == "Test"
+
+    def test_with_changes_matches_replace(self):
+        """Test with_changes copies fields like dataclasses.replace."""
+        result = SyslogParser.parse(b"<34>1 2024-01-15T12:30:45Z host app 1 ID47 - Test")
+        changed = result.with_changes({"hostname": None, "message": "Changed"})
+
+        assert changed == replace(result, hostname=None, message="Changed")
+        assert result.hostname == "host"
+        assert changed._rfc5424_bytes is None  # Encoding of the original is not carried
+
+    def test_repeated_header_fields_are_shared(self):
+        """Test that repeated hostnames and app names decode to one shared string."""
+        first = SyslogParser.parse(b"<34>1 - web-01 sshd 42 - - one")
+        second = SyslogParser.parse(b"<34>1 - web-01 sshd 42 - - two")
+        assert first.hostname == "web-01"
+        assert second.hostname is first.hostname
+        assert second.app_name is first.app_name
+
+        legacy = SyslogParser.parse(b"<34>Jan 15 12:30:45 web-01 sshd[42]: three")
+        assert legacy.hostname is first.hostname
+        assert legacy.proc_id is first.proc_id
+
+    def test_long_header_fields_are_not_shared(self):
+        """Test that over-long field values are decoded without being cached."""
+        hostname = b"h" * (MAX_SHARED_FIELD_LENGTH + 1)
+        first = SyslogParser.parse(b"<34>1 - " + hostname + b" app - - - one")
+        second = SyslogParser.parse(b"<34>1 - " + hostname + b" app - - - two")
+        assert first.hostname == hostname.decode()
+        assert second.hostname == first.hostname
+        assert hostname not in _shared_fields
@@ -1,12 +1,13 @@
 """Tests for message transformer."""
 
+import re
 from datetime import datetime
 
 import pytest
 
-from syslog_fwd.config import MaskConfig, ReplaceConfig, TransformConfig
+from syslog_fwd.config import MaskConfig, ReplaceConfig, TransformConfig, required_literal
 from syslog_fwd.parser import SyslogMessage
-from syslog_fwd.transformer import MessageTransformer
+from syslog_fwd.transformer import PRESET_TRANSFORMS, MessageTransformer
 
 
 def make_message(
@@ -322,6 +323,36 @@ class TestMessageTransformer:
         result = transformer.transform(msg, ["prefix-a", "prefix-c"])
         assert result.message == "[C][A]msg"
 
+    def test_fused_transforms_match_step_by_step(self):
+        """Test that folded transformation runs give the same result as one at a time."""
+        transforms = [
+            PRESET_TRANSFORMS["remove-pid"],
+            TransformConfig(name="rename", set_fields={"hostname": "edge", "severity": "3"}),
+            PRESET_TRANSFORMS["anonymize-ip"],
+            TransformConfig(name="tag", message_prefix="[fw] ", message_suffix=" #1"),
+            TransformConfig(name="alerts", match_pattern=r"^\[fw\] denied", message_suffix="!"),
+            TransformConfig(name="untag", message_replace=ReplaceConfig(pattern=r"^\[fw\] ")),
+            TransformConfig(name="wrap", message_prefix="<", message_suffix=">"),
+        ]
+        transformer = MessageTransformer(transforms)
+        names = [t.name for t in transforms]
+
+        for text in ("denied 10.0.0.1", "allowed 10.0.0.2"):
+            msg = make_message(message=text)
+            expected = msg
+            for name in names:
+                expected = MessageTransformer([t for t in transforms if t.name == name]).transform(
+                    expected
+                )
+            assert transformer.transform(msg) == expected
+            assert transformer.transform(msg, names) == expected
+
+        result = transformer.transform(make_message(message="denied 10.0.0.1"))
+        assert result.message == "<denied x.x.x.x #1!>"
+        assert result.hostname == "edge"
+        assert result.severity == 3
+        assert result.proc_id is None
+
     def test_transform_reload(self):
         """Test reloading transformer configuration."""
         initial_transforms = [
@@ -354,3 +385,128 @@ class TestMessageTransformer:
 
         assert msg.hostname == "original"  # Original unchanged
         assert result.hostname == "changed"  # New message changed
+
+    def test_multiple_masks_skip_clean_message(self):
+        """Test that a message no mask matches is returned untouched."""
+        transforms = [
+            TransformConfig(
+                name="mask-all",
+                mask_patterns=[
+                    MaskConfig(pattern=r"\d+\.\d+\.\d+\.\d+", replacement="x.x.x.x"),
+                    MaskConfig(pattern=r"password=\S+", replacement="password=***"),
+                ],
+            ),
+        ]
+        transformer = MessageTransformer(transforms)
+
+        msg = make_message(message="nothing sensitive here")
+        assert transformer.transform(msg) is msg
+
+        # A required literal is present but no mask matches
+        msg = make_message(message="version 1.2 released")
+        assert transformer.transform(msg) is msg
+
+        msg = make_message(message="from 10.0.0.1 password=hunter2")
+        assert transformer.transform(msg).message == "from x.x.x.x password=***"
+
+    def test_masks_with_group_conditionals_or_flags_still_mask(self):
+        """Test that masks the combined scan cannot express are still applied."""
+        for patterns, message in (
+            ([r"(a)?b", r"(<)?x(?(1)>|$)"], "secret <x> here"),
+            ([r"(a)?b", r"(?P<open><)?x(?(open)>|$)"], "secret <x> here"),
+            ([r"zzz", r"(?x) < x >"], "secret <x> here"),
+        ):
+            transformer = MessageTransformer(
+                [
+                    TransformConfig(
+                        name="mask",
+                        mask_patterns=[
+                            MaskConfig(pattern=p, replacement="MASKED") for p in patterns
+                        ],
+                    )
+                ]
+            )
+            result = transformer.transform(make_message(message=message))
+            assert result.message == "secret MASKED here"
+
+    def test_mask_skipped_without_required_literal(self):
+        """Test that a mask is not scanned for when its literal is absent."""
+        transformer = MessageTransformer([PRESET_TRANSFORMS["anonymize-ip"]])
+
+        msg = make_message(message="no address in this message")
+        assert transformer.transform(msg) is msg
+
+        msg = make_message(message="from 10.0.0.1 at host.example")
+        assert transformer.transform(msg).message == "from x.x.x.x at host.example"
+
+        assert required_literal(re.compile(r"\d+\.\d+")) == "."
+        assert required_literal(re.compile(r"user=\w+; ")) == "user="
+        assert required_literal(re.compile(r"foo|bar")) is None
+        assert required_literal(re.compile(r"(?i)secret")) is None
+
+    def test_unchanged_message_is_not_copied(self):
+        """Test that a transformation that changes nothing returns the same message."""
+        transformer = MessageTransformer(
+            [PRESET_TRANSFORMS["remove-pid"], PRESET_TRANSFORMS["anonymize-ip"]]
+        )
+
+        msg = make_message(proc_id=None, message="deploy of v1.2 done")
+        assert transformer.transform(msg) is msg
+
+        result = transformer.transform(make_message(proc_id="42", message="deploy of v1.2 done"))
+        assert result.proc_id is None
+        assert result.message == "deploy of v1.2 done"
+
+    def test_escaped_mask_patterns_still_mask(self):
+        """Test that masks written with hex or octal escapes are not skipped."""
+        for pattern in (r"t\x6fken=\S+", r"t\157ken=\S+"):
+            transformer = MessageTransformer(
+                [
+                    TransformConfig(
+                        name="mask-token",
+                        mask_patterns=[MaskConfig(pattern=pattern, replacement="token=***")],
+                    )
+                ]
+            )
+            result = transformer.transform(make_message(message="auth token=secret-value"))
+            assert result.message == "auth token=***"
+
+    def test_escaped_masks_pass_combined_literal_check(self):
+        """Test that the whole-transform literal check honours escaped literals."""
+        transformer = MessageTransformer(
+            [
+                TransformConfig(
+                    name="mask-secrets",
+                    mask_patterns=[
+                        MaskConfig(pattern=r"\x70asswd=\S+", replacement="passwd=***"),
+                        MaskConfig(pattern=r"\141pi_key=\S+", replacement="api_key=***"),
+                    ],
+                )
+            ]
+        )
+
+        msg = make_message(message="nothing to hide")
+        assert transformer.transform(msg) is msg
+
+        result = transformer.transform(make_message(message="passwd=hunter2 api_key=abc"))
+        assert result.message == "passwd=*** api_key=***"
+
+    def test_set_fields_rejects_non_integer_severity(self):
+        """Test that facility and severity must be set to integers."""
+        with pytest.raises(ValueError):
+            TransformConfig(name="bad", set_fields={"severity": "notice"})
+
+        transformer = MessageTransformer(
+            [TransformConfig(name="raise", set_fields={"severity": "3"})]
+        )
+        assert transformer.transform(make_message(severity=6)).severity == 3
+
+    def test_transform_names_resolved_after_reload(self):
+        """Test that a reused transform_names list follows a reload."""
+        transformer = MessageTransformer([TransformConfig(name="tag", message_prefix="[v1]")])
+        names = ["tag"]
+        msg = make_message(message="test")
+        assert transformer.transform(msg, names).message == "[v1]test"
+
+        transformer.reload([TransformConfig(name="tag", message_prefix="[v2]")])
+        assert transformer.transform(msg, names).message == "[v2]test"